@@ -25,6 +25,57 @@ except ImportError:
 
 import time
 import sys
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Gestos del demo indexados por código: (nombre, color BGR)
+GESTOS_DEMO = (
+    ("👌 Click Izquierdo", (255, 0, 0)),
+    ("🤟 Click Derecho", (0, 0, 255)),
+    ("✋ Cursor", (0, 255, 0)),
+)
+
+@dataclass
+class LandmarksManos:
+    """
+    Landmarks de todas las manos del frame actual, apiladas en un solo array.
+    
+    Decodifica el resultado de MediaPipe una sola vez y cachea bajo demanda las
+    coordenadas en píxeles y las matrices de distancias al cuadrado, de forma
+    que los gestos se evalúan para todas las manos en una única pasada vectorizada.
+    """
+    normalizados: "np.ndarray"  # (H, 21, 2) float32 en [0, 1]
+    ancho: int
+    altura: int
+    _pixeles: Optional["np.ndarray"] = field(default=None, repr=False)
+    _d2: Optional["np.ndarray"] = field(default=None, repr=False)
+    
+    @classmethod
+    def desde_mediapipe(cls, multi_landmarks, ancho, altura):
+        """Construye la estructura a partir de la lista de manos de MediaPipe"""
+        normalizados = np.array(
+            [[(lm.x, lm.y) for lm in mano.landmark] for mano in multi_landmarks],
+            dtype=np.float32)
+        return cls(normalizados, ancho, altura)
+    
+    @property
+    def pixeles(self):
+        """Coordenadas en píxeles (H, 21, 2) int32"""
+        if self._pixeles is None:
+            escala = np.array([self.ancho, self.altura], dtype=np.float32)
+            self._pixeles = (self.normalizados * escala).astype(np.int32)
+        return self._pixeles
+    
+    @property
+    def d2(self):
+        """Matrices (H, 21, 21) de distancias al cuadrado entre landmarks, en píxeles"""
+        if self._d2 is None:
+            p = self.pixeles.astype(np.float32)
+            sq = (p * p).sum(axis=2)
+            self._d2 = sq[:, :, None] + sq[:, None, :] - 2.0 * (p @ p.transpose(0, 2, 1))
+        return self._d2
 
 class DemoGestos:
     def __init__(self):
@@ -32,9 +83,10 @@ class DemoGestos:
         print("🚀 Iniciando Demo del Sistema de Control por Gestos")
         print("=" * 50)
         
-        # Configuración optimizada para demo
+        # Configuración optimizada para demo. El objeto Hands lo crea el hilo
+        # de inferencia, que es su único dueño
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.config_hands = dict(
             static_image_mode=False,
             max_num_hands=2,
             min_detection_confidence=0.8,
@@ -44,48 +96,102 @@ class DemoGestos:
         
         # Variables para demo
         self.gestos_detectados = []
-        self.tiempo_inicio = time.time()
-        
-    def detectar_gesto_simple(self, landmarks, ancho, altura):
-        """Detección simplificada de gestos para demo"""
-        puntos = []
-        for landmark in landmarks.landmark:
-            x, y = int(landmark.x * ancho), int(landmark.y * altura)
-            puntos.append((x, y))
-        
-        # Puntos clave
-        pulgar_punta = puntos[4]
-        indice_punta = puntos[8]
-        medio_punta = puntos[12]
-        
-        # Distancias
-        distancia_pulgar_indice = np.sqrt(
-            (pulgar_punta[0] - indice_punta[0])**2 + 
-            (pulgar_punta[1] - indice_punta[1])**2
-        )
+        self.gestos_unicos = set()  # Se actualiza al registrar, no se recalcula por frame
+        self.tiempo_inicio_ns = time.perf_counter_ns()  # Reloj monótono en enteros
         
-        distancia_pulgar_medio = np.sqrt(
-            (pulgar_punta[0] - medio_punta[0])**2 + 
-            (pulgar_punta[1] - medio_punta[1])**2
-        )
+    def detectar_gestos(self, manos: LandmarksManos):
+        """Detección simplificada de gestos para demo, para todas las manos a la vez"""
+        # Distancias al cuadrado pulgar(4)-índice(8) y pulgar(4)-medio(12) de
+        # cada mano, leídas de las matrices compartidas (umbral de 30 px al cuadrado)
+        click_izquierdo = manos.d2[:, 4, 8] < 900
+        click_derecho = manos.d2[:, 4, 12] < 900
         
-        # Detección de gestos
-        if distancia_pulgar_indice < 30:
-            return "👌 Click Izquierdo", (255, 0, 0)
-        elif distancia_pulgar_medio < 30:
-            return "🤟 Click Derecho", (0, 0, 255)
-        else:
-            return "✋ Cursor", (0, 255, 0)
+        # Códigos en GESTOS_DEMO con la misma prioridad que el if/elif original
+        codigos = np.where(click_izquierdo, 0, np.where(click_derecho, 1, 2))
+        return [GESTOS_DEMO[c] for c in codigos.tolist()]
     
-    def procesar_frame(self, frame):
-        """Procesa cada frame para el demo"""
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
+    def abrir_camara(self, dispositivo=0):
+        """Abre la cámara con backend nativo, MJPG y buffer mínimo para reducir latencia"""
+        backends = {
+            'win32': cv2.CAP_DSHOW,
+            'linux': cv2.CAP_V4L2,
+            'darwin': cv2.CAP_AVFOUNDATION,
+        }
+        cap = cv2.VideoCapture(dispositivo, backends.get(sys.platform, cv2.CAP_ANY))
+        if not cap.isOpened():
+            # Respaldo: dejar que OpenCV elija el backend
+            cap.release()
+            cap = cv2.VideoCapture(dispositivo)
         
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FPS, 60)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+    
+    @staticmethod
+    def _publicar(cola, elemento):
+        """Deja en la cola solo el elemento más reciente, descartando el anterior"""
+        try:
+            cola.put_nowait(elemento)
+        except queue.Full:
+            try:
+                cola.get_nowait()
+            except queue.Empty:
+                pass
+            cola.put_nowait(elemento)  # Cada cola tiene un único productor
+    
+    def _hilo_captura(self, cap, frames, detener):
+        """Productor: captura y voltea frames, publicando siempre el último"""
+        try:
+            while not detener.is_set():
+                # Cada frame necesita su propio buffer: viaja hasta el hilo de dibujo
+                ret, frame = cap.read()
+                if not ret:
+                    print("❌ Error capturando frame")
+                    break
+                
+                # Voltear horizontalmente para mejor experiencia (en el mismo buffer)
+                cv2.flip(frame, 1, dst=frame)
+                self._publicar(frames, frame)
+        finally:
+            # Este hilo es el único que lee la cámara: la libera él al salir, así
+            # nunca se libera durante una lectura pendiente
+            detener.set()
+            cap.release()
+    
+    def _hilo_inferencia(self, frames, resultados, detener):
+        """Consumidor/productor: ejecuta MediaPipe sobre el último frame disponible"""
+        hands = None
+        rgb = None  # Buffer RGB privado de este hilo
+        try:
+            hands = self.mp_hands.Hands(**self.config_hands)
+            while not detener.is_set():
+                try:
+                    frame = frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                if rgb is None or rgb.shape != frame.shape:
+                    rgb = np.empty_like(frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+                self._publicar(resultados, (frame, hands.process(rgb)))
+        except Exception as e:
+            print(f"❌ Error en la detección de manos: {e}")
+        finally:
+            # Si este hilo termina (p. ej. por un error de MediaPipe), el demo entero
+            # se detiene en lugar de quedarse esperando resultados que no llegarán
+            detener.set()
+            if hands is not None:
+                hands.close()
+    
+    def procesar_frame(self, frame, results):
+        """Dibuja sobre el frame la información del demo y los gestos detectados"""
         altura, ancho = frame.shape[:2]
         
         # Información de demo en pantalla
-        tiempo_transcurrido = int(time.time() - self.tiempo_inicio)
+        tiempo_transcurrido = (time.perf_counter_ns() - self.tiempo_inicio_ns) // 1_000_000_000
         cv2.putText(frame, f"DEMO - Tiempo: {tiempo_transcurrido}s", 
                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
@@ -101,36 +207,41 @@ class DemoGestos:
         cv2.putText(frame, "Presiona 'q' para salir", 
                    (10, altura - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
         
-        if results.multi_hand_landmarks:
-            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Dibujar landmarks
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                
-                # Detectar gesto
-                gesto, color = self.detectar_gesto_simple(hand_landmarks, ancho, altura)
-                
-                # Mostrar gesto detectado
-                cv2.putText(frame, f"Mano {hand_idx + 1}: {gesto}", 
-                           (10, 180 + hand_idx * 30), cv2.FONT_HERSHEY_SIMPLEX, 
-                           0.8, color, 2)
-                
-                # Agregar a historial
-                if gesto not in ["✋ Cursor"]:  # No registrar cursor constante
-                    timestamp = time.time() - self.tiempo_inicio
-                    self.gestos_detectados.append((timestamp, gesto))
-        
         # Mostrar estadísticas
-        gestos_unicos = len(set([g[1] for g in self.gestos_detectados]))
-        cv2.putText(frame, f"Gestos únicos detectados: {gestos_unicos}", 
+        cv2.putText(frame, f"Gestos únicos detectados: {len(self.gestos_unicos)}", 
                    (ancho - 400, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
         
+        # Sin manos no hay nada más que evaluar en este frame
+        if not results.multi_hand_landmarks:
+            return frame
+        
+        # Detectar gestos de todas las manos en una sola pasada
+        manos = LandmarksManos.desde_mediapipe(results.multi_hand_landmarks, ancho, altura)
+        gestos = self.detectar_gestos(manos)
+        
+        for hand_idx, (hand_landmarks, (gesto, color)) in enumerate(
+                zip(results.multi_hand_landmarks, gestos)):
+            # Dibujar landmarks
+            self.mp_drawing.draw_landmarks(
+                frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+            
+            # Mostrar gesto detectado
+            cv2.putText(frame, f"Mano {hand_idx + 1}: {gesto}", 
+                       (10, 180 + hand_idx * 30), cv2.FONT_HERSHEY_SIMPLEX, 
+                       0.8, color, 2)
+            
+            # Agregar a historial
+            if gesto not in ["✋ Cursor"]:  # No registrar cursor constante
+                timestamp = time.perf_counter_ns() - self.tiempo_inicio_ns  # ns
+                self.gestos_detectados.append((timestamp, gesto))
+                self.gestos_unicos.add(gesto)
+        
         return frame
     
     def ejecutar_demo(self):
         """Ejecuta la demostración"""
         print("📷 Iniciando cámara...")
-        cap = cv2.VideoCapture(0)
+        cap = self.abrir_camara(0)
         
         if not cap.isOpened():
             print("❌ No se pudo acceder a la cámara")
@@ -145,18 +256,31 @@ class DemoGestos:
         
         cv2.namedWindow('Demo - Control por Gestos', cv2.WINDOW_AUTOSIZE)
         
+        # Pipeline captura -> inferencia -> dibujo. Colas de un elemento: si una
+        # etapa va lenta se descarta el frame viejo en lugar de acumular retraso
+        frames = queue.Queue(maxsize=1)
+        resultados = queue.Queue(maxsize=1)
+        detener = threading.Event()
+        hilos = [
+            threading.Thread(target=self._hilo_captura, args=(cap, frames, detener), daemon=True),
+            threading.Thread(target=self._hilo_inferencia, args=(frames, resultados, detener), daemon=True),
+        ]
+        for hilo in hilos:
+            hilo.start()
+        
         try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    print("❌ Error capturando frame")
-                    break
-                
-                # Voltear horizontalmente para mejor experiencia
-                frame = cv2.flip(frame, 1)
+            # Dibujo y ventana en el hilo principal (requisito de HighGUI)
+            while not detener.is_set():
+                try:
+                    frame, results = resultados.get(timeout=0.1)
+                except queue.Empty:
+                    # Sin resultado nuevo la ventana sigue atendiendo eventos y la 'q'
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
+                        break
+                    continue
                 
                 # Procesar frame
-                frame_procesado = self.procesar_frame(frame)
+                frame_procesado = self.procesar_frame(frame, results)
                 
                 # Mostrar resultado
                 cv2.imshow('Demo - Control por Gestos', frame_procesado)
@@ -169,7 +293,9 @@ class DemoGestos:
             print("\n⚠️ Demo interrumpido por el usuario")
         
         finally:
-            cap.release()
+            detener.set()
+            for hilo in hilos:
+                hilo.join(timeout=1.0)
             cv2.destroyAllWindows()
             self.mostrar_resumen()
         
@@ -181,14 +307,13 @@ class DemoGestos:
         print("    RESUMEN DEL DEMO")
         print("=" * 50)
         
-        tiempo_total = time.time() - self.tiempo_inicio
+        tiempo_total = (time.perf_counter_ns() - self.tiempo_inicio_ns) / 1e9
         print(f"⏱️  Duración del demo: {tiempo_total:.1f} segundos")
         print(f"🎯 Total de gestos detectados: {len(self.gestos_detectados)}")
         
         if self.gestos_detectados:
-            gestos_unicos = set([g[1] for g in self.gestos_detectados])
-            print(f"🎮 Gestos únicos probados: {len(gestos_unicos)}")
-            for gesto in gestos_unicos:
+            print(f"🎮 Gestos únicos probados: {len(self.gestos_unicos)}")
+            for gesto in self.gestos_unicos:
                 print(f"   • {gesto}")
         
         print("\n🎉 ¡Demo completado!")
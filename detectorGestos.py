@@ -19,21 +19,68 @@ Autor: Sistema de Control por Gestos
 Versión: 3.0 (Definitiva)
 """
 
+import os
+import sys
+
+# cpuinfo es opcional: solo se usa para elegir las extensiones SIMD de XNNPACK
+try:
+    import cpuinfo  # type: ignore
+except ImportError:
+    cpuinfo = None
+
+def _configurar_backend_inferencia() -> str:
+    """
+    Ajusta XNNPACK (backend CPU de MediaPipe) a las extensiones SIMD de esta CPU.
+    
+    Debe ejecutarse antes de importar mediapipe. Las extensiones que la CPU no
+    soporta (o que no se pueden comprobar) se desactivan para evitar fallos;
+    las variables ya definidas por el usuario se respetan.
+    """
+    flags = set()
+    if cpuinfo is not None:
+        try:
+            flags = set(cpuinfo.get_cpu_info().get('flags', []))
+        except Exception:
+            flags = set()
+    
+    for flag, variable in (('avxvnniint8', 'TF_XNNPACK_ENABLE_AVXVNNIINT8'),
+                           ('avx512fp16', 'TF_XNNPACK_ENABLE_AVX512FP16')):
+        if flag not in flags:
+            os.environ.setdefault(variable, '0')
+    
+    # La solución Hands de Python corre en CPU; no inicializar el contexto GPU
+    os.environ.setdefault('MEDIAPIPE_DISABLE_GPU', '1')
+    
+    simd = [f for f in ('avx512f', 'avx2', 'neon', 'asimd') if f in flags]
+    return f"XNNPACK (CPU, {'/'.join(simd) if simd else 'SIMD no detectado'})"
+
+BACKEND_INFERENCIA = _configurar_backend_inferencia()
+
 import cv2
 import mediapipe as mp
 import numpy as np
 import time
 import pyautogui
-import sys
-import os
 import json
 import logging
 import argparse
+import threading
+from collections import deque
+from itertools import chain
+from operator import attrgetter
+from math import log2, sqrt
 from pathlib import Path
 from typing import Tuple, Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
+# orjson es opcional: si está instalado se usa para leer config.json
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -44,11 +91,59 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+logger.info(f"Backend de inferencia: {BACKEND_INFERENCIA}")
 
 # Configurar pyautogui para que sea seguro y funcione correctamente
-pyautogui.PAUSE = 0.01
+# Sin pausa tras cada llamada (10 ms por movimiento o click): el espaciado entre
+# eventos de botón se controla con el reloj monótono del detector
+pyautogui.PAUSE = 0
 pyautogui.FAILSAFE_POINTS = [(0, 0)]  # Solo esquina superior izquierda como punto de seguridad
 
+def _crear_mover_cursor_nativo():
+    """
+    Devuelve mover(x, y) con la llamada nativa del sistema (SetCursorPos, Quartz
+    o XTest), sin la pausa ni la contabilidad de pyautogui, o None si no hay.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            set_cursor_pos = ctypes.windll.user32.SetCursorPos
+            return lambda x, y: set_cursor_pos(int(x), int(y))
+        if sys.platform == 'darwin':
+            import Quartz  # type: ignore
+            
+            def mover(x, y):
+                # Evento kCGEventMouseMoved (como pyautogui): CGWarpMouseCursorPosition
+                # mueve el cursor sin avisar a las apps, sin hover ni tooltips
+                evento = Quartz.CGEventCreateMouseEvent(
+                    None, Quartz.kCGEventMouseMoved, (x, y), Quartz.kCGMouseButtonLeft)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, evento)
+            return mover
+        from Xlib import X, display  # type: ignore
+        from Xlib.ext import xtest  # type: ignore
+        pantalla = display.Display()
+        
+        def mover(x, y):
+            xtest.fake_input(pantalla, X.MotionNotify, x=int(x), y=int(y))
+            pantalla.sync()
+        return mover
+    except Exception as e:
+        logger.info(f"Movimiento nativo del cursor no disponible ({e}); se usa pyautogui")
+        return None
+
+MOVER_CURSOR_NATIVO = _crear_mover_cursor_nativo()
+
+# Fuente de todos los textos de la interfaz
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Backend de captura nativo por plataforma: evita la negociación del backend
+# por defecto, que suele entregar YUYV sin comprimir con varios frames en cola
+BACKEND_CAMARA = {
+    'win32': cv2.CAP_DSHOW,
+    'linux': cv2.CAP_V4L2,
+    'darwin': cv2.CAP_AVFOUNDATION,
+}.get(sys.platform, cv2.CAP_ANY)
+
 # ================================
 # CLASES Y TIPOS DE DATOS
 # ================================
@@ -68,6 +163,23 @@ class TipoGesto(Enum):
     ZOOM_OUT = "zoom_out"
     NINGUNO = "ninguno"
 
+# Códigos enteros de gesto para el camino por frame (comparar int es más barato
+# que comparar miembros de Enum); TipoGesto solo se usa al construir InfoGesto
+GESTO_CURSOR = 0
+GESTO_CLICK_IZQUIERDO = 1
+GESTO_DOBLE_CLICK = 2
+GESTO_CLICK_DERECHO = 3
+GESTO_ZOOM_IN = 4
+GESTO_ZOOM_OUT = 5
+GESTO_NINGUNO = 6
+_TIPOS_GESTO = tuple(TipoGesto)  # Índice = código entero
+_CODIGOS_GESTO = {g: i for i, g in enumerate(_TIPOS_GESTO)}
+
+# Textos de interfaz precalculados por gesto y por modo (evita formatear cada frame)
+_ETIQUETAS_GESTO = {g: f"Gesto: {g.value.replace('_', ' ').title()}" for g in TipoGesto}
+_TITULOS_MODO = {m: f"Detector de Gestos v3.0 - {m.value.title()}" for m in ModoOperacion}
+_ETIQUETAS_MODO = {m: f"Modo: {m.value.upper()}" for m in ModoOperacion}
+
 @dataclass
 class ConfiguracionSistema:
     """Configuración del sistema con valores por defecto"""
@@ -75,20 +187,48 @@ class ConfiguracionSistema:
     min_detection_confidence: float = 0.7
     min_tracking_confidence: float = 0.5
     max_num_hands: int = 2
+    model_complexity: int = 0  # 0 = modelo ligero (más rápido), 1 = completo
+    lado_max_inferencia: int = 320  # Lado mayor del frame que recibe MediaPipe (se dibuja a resolución completa)
+    fps_inferencia_max: float = 0.0  # Límite de inferencias por segundo (0 = sin límite)
+    pipeline_inferencia: bool = False  # Inferencia en segundo plano (+1 frame de latencia)
+    recorte_roi: bool = False  # Inferir solo en la zona de las manos del frame anterior (experimental)
     
     # Gestos
     distancia_pinza: int = 40
     factor_zoom_in: float = 1.5
     factor_zoom_out: float = 0.7
     suavizado_movimiento: int = 5
+    alfa_suavizado: float = 0.0  # Peso de la posición nueva en la EMA (0 = 2 / (suavizado_movimiento + 1))
     doble_click_ventana: float = 0.5
     tiempo_calibracion: float = 3.0
     
     # Interfaz
     mostrar_por_defecto: bool = True
+    dibujar_landmarks: bool = True  # Esqueleto de la mano sobre el frame (con la interfaz visible)
     color_primario: Tuple[int, int, int] = (0, 255, 0)
     color_secundario: Tuple[int, int, int] = (255, 255, 0)
     color_error: Tuple[int, int, int] = (0, 0, 255)
+    
+    # Sección de config.json en la que vive cada campo
+    _SECCIONES = {
+        'deteccion': ('min_detection_confidence', 'min_tracking_confidence', 'max_num_hands',
+                      'model_complexity', 'lado_max_inferencia', 'fps_inferencia_max',
+                      'pipeline_inferencia', 'recorte_roi'),
+        'gestos': ('distancia_pinza', 'factor_zoom_in', 'factor_zoom_out', 'suavizado_movimiento',
+                   'alfa_suavizado', 'doble_click_ventana', 'tiempo_calibracion'),
+        'interfaz': ('mostrar_por_defecto', 'dibujar_landmarks'),
+    }
+    
+    @classmethod
+    def desde_config(cls, config: Dict[str, Any]) -> "ConfiguracionSistema":
+        """Crea la configuración desde el diccionario anidado de config.json (faltantes = por defecto)"""
+        valores = {}
+        for seccion, campos in cls._SECCIONES.items():
+            datos = config.get(seccion) or {}
+            for campo in campos:
+                if campo in datos:
+                    valores[campo] = datos[campo]
+        return cls(**valores)
 
 @dataclass
 class InfoGesto:
@@ -97,12 +237,253 @@ class InfoGesto:
     posicion: Optional[Tuple[int, int]] = None
     confianza: float = 0.0
     metadatos: Dict[str, Any] = None
+    codigo: int = -1  # Código entero GESTO_*; se deduce de 'gesto' si no se indica
+    
+    def __post_init__(self):
+        if self.codigo < 0:
+            self.codigo = _CODIGOS_GESTO[self.gesto]
+
+def _info_gesto(codigo: int, posicion: Optional[Tuple[int, int]] = None,
+                confianza: float = 0.0, metadatos: Optional[Dict[str, Any]] = None) -> InfoGesto:
+    """Construye el InfoGesto de un código GESTO_* (frontera entre int y TipoGesto)"""
+    return InfoGesto(gesto=_TIPOS_GESTO[codigo], posicion=posicion,
+                     confianza=confianza, metadatos=metadatos, codigo=codigo)
+
+_XY = attrgetter('x', 'y')
+
+def _landmarks_a_pixeles(landmarks, ancho: int, altura: int) -> np.ndarray:
+    """Convierte los 21 landmarks normalizados de MediaPipe a un array (21, 2) int32 en píxeles"""
+    normalizados = np.fromiter(
+        chain.from_iterable(map(_XY, landmarks.landmark)),
+        dtype=np.float32, count=42).reshape(21, 2)
+    normalizados *= (ancho, altura)
+    return normalizados.astype(np.int32)
+
+def _crear_sello(circulos) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasteriza una vez círculos concéntricos (radio, color, grosor) en un lienzo
+    pequeño centrado, junto con la máscara de los píxeles pintados.
+    """
+    radio = max(r + max(grosor, 0) for r, _, grosor in circulos)
+    lado = 2 * radio + 1
+    sello = np.zeros((lado, lado, 3), dtype=np.uint8)
+    mascara = np.zeros((lado, lado), dtype=np.uint8)
+    for r, color, grosor in circulos:
+        cv2.circle(sello, (radio, radio), r, color, grosor)
+        cv2.circle(mascara, (radio, radio), r, 255, grosor)
+    return sello, mascara.astype(bool)[..., None]
+
+def _estampar(frame: np.ndarray, sello: np.ndarray, mascara: np.ndarray, centro: Tuple[int, int]):
+    """Copia un sello de _crear_sello centrado en 'centro', recortado a los bordes del frame"""
+    radio = sello.shape[0] // 2
+    x, y = centro
+    altura, ancho = frame.shape[:2]
+    x0, y0 = max(x - radio, 0), max(y - radio, 0)
+    x1, y1 = min(x + radio + 1, ancho), min(y + radio + 1, altura)
+    if x0 >= x1 or y0 >= y1:
+        return
+    sx, sy = x0 - (x - radio), y0 - (y - radio)
+    filas = slice(sy, sy + (y1 - y0))
+    columnas = slice(sx, sx + (x1 - x0))
+    np.copyto(frame[y0:y1, x0:x1], sello[filas, columnas], where=mascara[filas, columnas])
+
+def _rectangulo_panel(frame: np.ndarray, esquina_1: Tuple[int, int], esquina_2: Tuple[int, int],
+                      color: Tuple[int, int, int], color_borde: Tuple[int, int, int], grosor: int = 2):
+    """
+    Equivale a cv2.rectangle relleno seguido del borde (grosor 1 o 2) usando
+    asignación por slices: pinta los mismos píxeles, recortados al frame.
+    """
+    (x1, y1), (x2, y2) = esquina_1, esquina_2
+    g = grosor // 2  # El borde se extiende g px a cada lado de la línea
+    frame[max(y1, 0):max(y2 + 1, 0), max(x1, 0):max(x2 + 1, 0)] = color
+    columnas = slice(max(x1, 0), max(x2 + 1, 0))
+    filas = slice(max(y1, 0), max(y2 + 1, 0))
+    for y in (y1, y2):
+        frame[max(y - g, 0):max(y + g + 1, 0), columnas] = color_borde
+    for x in (x1, x2):
+        frame[filas, max(x - g, 0):max(x + g + 1, 0)] = color_borde
+
+# Predicados por frame: versión compilada (kernels_gestos.pyx) si está disponible
+try:
+    from kernels_gestos import indice_extendido, puno_cerrado, transformar_punto  # type: ignore
+    KERNELS_COMPILADOS = True
+except ImportError:
+    KERNELS_COMPILADOS = False
+    
+    def indice_extendido(pts: np.ndarray) -> bool:
+        """Índice extendido (tip más alto que pip) y el resto de dedos doblados"""
+        return bool(pts[8, 1] < pts[6, 1] and
+                    pts[12, 1] > pts[10, 1] and
+                    pts[16, 1] > pts[14, 1] and
+                    pts[20, 1] > pts[18, 1])
+    
+    def puno_cerrado(pts: np.ndarray) -> bool:
+        """Todos los dedos doblados (tip más bajo que pip)"""
+        return bool(pts[8, 1] > pts[6, 1] and
+                    pts[12, 1] > pts[10, 1] and
+                    pts[16, 1] > pts[14, 1] and
+                    pts[20, 1] > pts[18, 1])
+    
+    def transformar_punto(H: np.ndarray, x: float, y: float) -> Tuple[int, int]:
+        """Aplica la homografía H a (x, y) y devuelve coordenadas enteras"""
+        (h0, h1, h2), (h3, h4, h5), (h6, h7, h8) = H.tolist()
+        u = h0 * x + h1 * y + h2
+        v = h3 * x + h4 * y + h5
+        w = h6 * x + h7 * y + h8
+        if w != 0.0:
+            u /= w
+            v /= w
+        return (int(u), int(v))
+
+# Clasificación de la pinza por frame: JIT con numba si está instalado
+try:
+    from numba import njit  # type: ignore
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    
+    def njit(*args, **kwargs):
+        """Sustituto sin numba: deja la función en Python"""
+        def decorador(funcion):
+            return funcion
+        return decorador
+
+# Códigos que devuelve clasificar_pinza
+PINZA_NINGUNA = 0    # Mano abierta (cursor)
+PINZA_IZQUIERDA = 1  # Pulgar + índice
+PINZA_DEBIL = 2      # Pulgar + índice con la mano lejos y la pinza poco cerrada
+PINZA_DERECHA = 3    # Pulgar + medio
+
+@njit(cache=True, fastmath=True)
+def distancia2_landmarks(pts, i, j):
+    """Distancia al cuadrado entre los landmarks i y j de una mano (21, 2) en píxeles"""
+    dx = pts[i, 0] - pts[j, 0]
+    dy = pts[i, 1] - pts[j, 1]
+    return dx * dx + dy * dy
+
+@njit(cache=True, fastmath=True)
+def clasificar_pinza(pts, umbral_pinza2, factor_distancia):
+    """
+    Clasifica la pinza de una mano a partir de sus landmarks (21, 2) en píxeles.
+    
+    Devuelve (código, x, y): el punto medio de la pinza para los clicks, o la
+    punta del índice en el resto de casos.
+    """
+    dx = pts[4, 0] - pts[8, 0]
+    dy = pts[4, 1] - pts[8, 1]
+    d2_pulgar_indice = dx * dx + dy * dy
+    if d2_pulgar_indice < umbral_pinza2:
+        if factor_distancia > 0.7 or d2_pulgar_indice < 20 * 20:
+            return PINZA_IZQUIERDA, (pts[4, 0] + pts[8, 0]) // 2, (pts[4, 1] + pts[8, 1]) // 2
+        return PINZA_DEBIL, pts[8, 0], pts[8, 1]
+    
+    dx = pts[4, 0] - pts[12, 0]
+    dy = pts[4, 1] - pts[12, 1]
+    if dx * dx + dy * dy < umbral_pinza2:
+        return PINZA_DERECHA, (pts[4, 0] + pts[12, 0]) // 2, (pts[4, 1] + pts[12, 1]) // 2
+    
+    return PINZA_NINGUNA, pts[8, 0], pts[8, 1]
+
+@njit(cache=True, fastmath=True)
+def clasificar_gesto_mano(pts, umbral_pinza2, factor_distancia, pinza_tras_doble,
+                          boton_presionado, dt_ultimo_click, ventana_doble_click,
+                          ultimo_x, ultimo_y):
+    """
+    Decide el gesto de una mano a partir de sus landmarks (21, 2) en píxeles.
+    
+    Devuelve (código GESTO_*, x, y, confianza, pinza_indice). El estado (pinza
+    tras doble click, último click) lo actualiza quien llama según el resultado.
+    """
+    codigo, x, y = clasificar_pinza(pts, umbral_pinza2, factor_distancia)
+    
+    if codigo == PINZA_NINGUNA:
+        # Mano abierta: cursor con la punta del índice
+        return GESTO_CURSOR, x, y, 0.8, False
+    if codigo == PINZA_DERECHA:
+        return GESTO_CLICK_DERECHO, x, y, 0.9, False
+    
+    # Pinza pulgar+índice mantenida tras un doble click: no iniciar un arrastre hasta soltarla
+    if pinza_tras_doble:
+        return GESTO_NINGUNO, x, y, 0.0, True
+    # Pinza débil (mano lejos y poco cerrada): solo cursor
+    if codigo == PINZA_DEBIL:
+        return GESTO_CURSOR, pts[8, 0], pts[8, 1], 0.7, True
+    # Nueva pinza: una sola comparación decide doble click (dentro de la ventana de
+    # tiempo y a menos de 15 px de la anterior, sin raíz cuadrada) o click
+    dx = x - ultimo_x
+    dy = y - ultimo_y
+    doble = (not boton_presionado and dt_ultimo_click < ventana_doble_click
+             and dx * dx + dy * dy < 15 * 15)
+    return (GESTO_DOBLE_CLICK if doble else GESTO_CLICK_IZQUIERDO), x, y, 0.9, True
 
 class DetectorGestos:
     """
     Detector de gestos principal que combina lo mejor de ambas versiones
     """
     
+    # config.json parseado, compartido por todas las instancias
+    _CONFIG_CACHE: Optional[Dict[str, Any]] = None
+    _CONFIG_MTIME: Optional[int] = None  # st_mtime_ns de config.json al parsearlo
+    
+    # Textos fijos de los paneles de la interfaz
+    _CONTROLES_PANEL = (
+        "ESC/Q - Salir",
+        "V - Mostrar/Ocultar UI", 
+        "M - Modo (Pantalla/Mesa)",
+        "K - Cambiar camara",
+        "C - Calibracion manual",
+        "A - Deteccion automatica",
+        "R - Reset sistema",
+        "+/- - Ajustar margen (Mesa)"
+    )
+    _GESTOS_PANEL = (
+        "🖐️ Mano abierta - Cursor",
+        "👌 Pulgar+Indice - Click L",
+        "🤏 Pulgar+Medio - Click R", 
+        "⚡ Doble pinza - Doble click",
+        "👊👊 Dos manos - Zoom"
+    )
+    _CONTROLES_TECLADO = (
+        "ESC/Q - Salir del programa",
+        "V - Mostrar/Ocultar interfaz", 
+        "M - Cambiar modo (Pantalla/Mesa)",
+        "K - Cambiar camara",
+        "C - Calibracion manual (modo mesa)",
+        "A - Deteccion automatica (modo mesa)",
+        "R - Reset calibracion/zoom",
+    )
+    
+    # Votación de gestos: una acción discreta (click, click derecho) solo se dispara
+    # si su gesto aparece en al menos _VOTOS_MINIMOS de los últimos frames (doble
+    # click y zoom son eventos de un solo frame y no pasan por la votación)
+    _VENTANA_VOTOS = 5
+    _VOTOS_MINIMOS = 3
+    # Desplazamiento mínimo (px de pantalla, |dx| + |dy|) para llamar a moveTo
+    _UMBRAL_CURSOR_PX = 2
+    # Separación mínima (ns) entre eventos de botón (mouseDown, click, click derecho)
+    _ESPACIO_MIN_BOTON_NS = 30_000_000
+    # Separación mínima (ns) entre scrolls de zoom (un frame)
+    _COOLDOWN_ZOOM_NS = 30_000_000
+    # Con el movimiento nativo, cada cuántos movimientos se comprueba el FailSafe
+    _VERIFICAR_FAILSAFE_CADA = 10
+    # Recorte por ROI: margen añadido a cada lado de la caja de las manos (fracción
+    # de su tamaño), área máxima que aún compensa recortar y confianza mínima
+    _MARGEN_ROI = 0.3
+    _AREA_MAX_ROI = 0.6
+    _CONFIANZA_MIN_ROI = 0.5
+    # Cada cuántas inferencias sobre la ROI se vuelve a mirar el frame completo
+    # (para ver manos que entran fuera de la ROI cuando ya se siguen todas)
+    _REDETECCION_CADA = 30
+    # Salto adaptativo: si ningún landmark se movió más de estos píxeles entre dos
+    # inferencias, las manos están quietas y se infiere uno de cada _PASO_MANOS_QUIETAS
+    _MOVIMIENTO_QUIETO_PX = 6
+    _PASO_MANOS_QUIETAS = 3
+    # Zoom: cambio mínimo de distancia entre manos (el mayor entre px y fracción de la
+    # distancia anterior); invertir el sentido del zoom exige _HISTERESIS_ZOOM veces más
+    _UMBRAL_ZOOM_PX = 15
+    _UMBRAL_ZOOM_RELATIVO = 0.05
+    _HISTERESIS_ZOOM = 2
+    
     def __init__(self, modo: str = "pantalla"):
         """
         Inicializa el detector de gestos
@@ -116,72 +497,134 @@ class DetectorGestos:
         self.config = self._cargar_configuracion()
         
         # Extraer solo los campos válidos para ConfiguracionSistema
-        sistema_config = self.config.get('sistema', {})
-        config_valida = {
-            'min_detection_confidence': self.config.get('deteccion', {}).get('min_detection_confidence', 0.7),
-            'min_tracking_confidence': self.config.get('deteccion', {}).get('min_tracking_confidence', 0.5),
-            'max_num_hands': self.config.get('deteccion', {}).get('max_num_hands', 2),
-            'distancia_pinza': self.config.get('gestos', {}).get('distancia_pinza', 40),
-            'factor_zoom_in': self.config.get('gestos', {}).get('factor_zoom_in', 1.5),
-            'factor_zoom_out': self.config.get('gestos', {}).get('factor_zoom_out', 0.7),
-            'suavizado_movimiento': self.config.get('gestos', {}).get('suavizado_movimiento', 5),
-            'doble_click_ventana': self.config.get('gestos', {}).get('doble_click_ventana', 0.5),
-            'tiempo_calibracion': self.config.get('gestos', {}).get('tiempo_calibracion', 3.0),
-            'mostrar_por_defecto': self.config.get('interfaz', {}).get('mostrar_por_defecto', True)
-        }
-        self.configuracion = ConfiguracionSistema(**config_valida)
+        self.configuracion = ConfiguracionSistema.desde_config(self.config)
         
         # Inicializar MediaPipe Hands
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=self.configuracion.max_num_hands,
+            model_complexity=self.configuracion.model_complexity,
             min_detection_confidence=self.configuracion.min_detection_confidence,
             min_tracking_confidence=self.configuracion.min_tracking_confidence
         )
         self.mp_drawing = mp.solutions.drawing_utils
+        # Pares (inicio, fin) de las conexiones de la mano, para dibujarlas en una sola llamada
+        self._conexiones_mano = np.array(sorted(self.mp_hands.HAND_CONNECTIONS), dtype=np.intp)
+        
+        # Salto de frames: se reutilizan los últimos landmarks entre inferencias
+        self._frame_idx = 0
+        self._frame_ultima_inferencia = 0
+        self._paso_inferencia = 2  # Frames entre inferencias en reposo (según movimiento)
+        self._ultimos_resultados = None
+        self._tiempo_ultima_inferencia = 0.0
+        # Buffers planos reutilizados para la entrada de MediaPipe (reducción y RGB);
+        # solo crecen, así que los recortes de ROI de tamaño variable no reservan memoria
+        self._reducido_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+        # Con pipeline_inferencia se alternan dos buffers RGB: mientras el hilo lee
+        # uno, el frame siguiente se escribe en el otro (sin copiar la imagen)
+        self._rgb_buf_alterno: Optional[np.ndarray] = None
+        self._usar_buf_alterno = False
+        self._pool = None  # Hilo de inferencia (solo con pipeline_inferencia)
+        self._futuro_inferencia = None
+        self._roi_previo = None  # (x0, y0, x1, y1) normalizado, de los landmarks anteriores
+        self._inferencias_con_roi = 0
+        self._manos_px: List[np.ndarray] = []  # Landmarks (21, 2) en píxeles de la última inferencia
+        # Preprocesado en GPU (T-API de OpenCV) solo si hay un dispositivo OpenCL
+        self._usar_opencl = cv2.ocl.haveOpenCL()
+        if self._usar_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            logger.info("OpenCL disponible: preprocesado de frames grandes en GPU")
         
         # Obtener tamaño de la pantalla
         self.ancho_pantalla, self.alto_pantalla = pyautogui.size()
         logger.info(f"Resolución de pantalla: {self.ancho_pantalla}x{self.alto_pantalla}")
+        # Escala frame -> pantalla en modo pantalla (640x480 hasta conocer el frame real)
+        self.actualizar_tamaño_frame(640, 480)
         
         # Variables de estado para gestos
         self.cursor_x, self.cursor_y = 0, 0
+        self._votos_gesto = deque(maxlen=self._VENTANA_VOTOS)  # Códigos GESTO_* recientes
+        self._movimientos_nativos = 0
+        self._ultimo_aviso_failsafe = 0  # monotonic_ns del último aviso de FailSafe al mover
+        self._tiempo_ultimo_boton = 0  # Último evento de botón enviado (monotonic_ns)
+        # Indicador por código de gesto: (color, texto, radio); el cursor con el
+        # índice extendido (confianza > 0.9) usa la variante de precisión
+        self._render_gesto = {
+            GESTO_CURSOR: (self.configuracion.color_primario, "CURSOR", 20),
+            GESTO_CLICK_IZQUIERDO: ((255, 0, 0), "CLICK", 25),
+            GESTO_DOBLE_CLICK: ((255, 100, 0), "DOBLE CLICK", 30),
+            GESTO_CLICK_DERECHO: ((0, 0, 255), "CLICK DER", 25),
+            GESTO_ZOOM_IN: ((255, 255, 0), "ZOOM", 35),
+            GESTO_ZOOM_OUT: ((255, 255, 0), "ZOOM", 35),
+        }
+        self._render_precision = ((0, 255, 255), "PRECISION", 15)
+        # Despacho por tabla: código de gesto -> acción y código de tecla -> acción
+        self._acciones = {
+            GESTO_CURSOR: self._accion_cursor,
+            GESTO_CLICK_IZQUIERDO: self._accion_click_izquierdo,
+            GESTO_DOBLE_CLICK: self._accion_doble_click,
+            GESTO_CLICK_DERECHO: self._accion_click_derecho,
+            GESTO_ZOOM_IN: self._accion_zoom_in,
+            GESTO_ZOOM_OUT: self._accion_zoom_out,
+        }
+        self._teclas = self._crear_tabla_teclas()
+        self._click_derecho_hecho = False  # Un solo click derecho por pinza mantenida
         self.arrastrando = False
         self.boton_presionado = False  # Estado del botón del mouse para arrastre
         
         # Variables para calibración automática de distancia
         self.tamaño_mano_referencia = None  # Tamaño promedio de la mano
         self.factor_distancia = 1.0  # Factor de ajuste basado en distancia
-        self.historial_tamaños_mano = []  # Últimos 10 tamaños para promedio
+        self.historial_tamaños_mano = deque(maxlen=10)  # Últimos 10 tamaños para promedio
+        self._suma_tamaños_mano = 0.0  # Suma acumulada del historial
         self.distancia_pinza_adaptativa = self.configuracion.distancia_pinza
-        self.ultimo_click_tiempo = 0
+        self._pinza_umbral_sq = float(self.distancia_pinza_adaptativa) ** 2  # Umbral al cuadrado
+        if NUMBA_DISPONIBLE:
+            # Compilar el kernel ahora y no en el primer frame con mano
+            clasificar_gesto_mano(np.zeros((21, 2), dtype=np.int32), 1.0, 1.0,
+                                  False, False, 1, 0, 0, 0)
+            distancia2_landmarks(np.zeros((21, 2), dtype=np.int32), 0, 12)
+        self.ultimo_click_tiempo = 0  # monotonic_ns del último click
+        self.ultimo_click_pos = (0, 0)  # Posición (cámara) de la última pinza que inició click
+        self._pinza_tras_doble = False  # Pinza aún cerrada después de un doble click
         self.click_count = 0
         self.gesto_anterior = TipoGesto.NINGUNO
-        self.tiempo_gesto_anterior = time.time()
+        self.tiempo_gesto_anterior = time.monotonic()
         
         # Variables para zoom con dos puños
         self.zoom_activo = False
         self.distancia_puños_anterior = 0
+        self._sentido_zoom = 0  # +1 acercando, -1 alejando, 0 sin zoom previo
         self.zoom_base = 1.0
-        self.cooldown_zoom = 0
+        self.cooldown_zoom = 0  # monotonic_ns del último scroll de zoom
         
-        # Suavizado de movimiento
-        self.historial_x = []
-        self.historial_y = []
-        self.suavizado = self.configuracion.suavizado_movimiento
+        # Suavizado de movimiento: media móvil exponencial (sin buffer). Por defecto el
+        # alfa equivale a la media de 'suavizado_movimiento' frames con menos retardo
+        self.suavizado = max(1, self.configuracion.suavizado_movimiento)
+        self._alfa_suavizado = self.configuracion.alfa_suavizado or 2.0 / (self.suavizado + 1)
+        self._ema_x: Optional[float] = None
+        self._ema_y: Optional[float] = None
         
         # Matriz de transformación para mapear coordenadas entre la cámara y proyección
-        self.matriz_transformacion = np.eye(3)  # Identidad por defecto
+        self.matriz_transformacion = np.eye(3)  # Identidad por defecto (float64 contigua)
+        self.matriz_inversa = np.eye(3)  # Proyección -> cámara, precalculada
+        self._h = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)  # matriz_transformacion aplanada
         
         # Variables para calibración mejorada
         self.calibrando = False
-        self.puntos_camara = []
-        self.puntos_proyeccion = []
+        # Esquinas calibradas (cámara y proyección) en buffers fijos de 4 puntos;
+        # solo las primeras n_puntos_calibrados filas son válidas
+        self.puntos_camara = np.zeros((4, 2), dtype=np.float32)
+        self.puntos_proyeccion = np.zeros((4, 2), dtype=np.float32)
+        self.n_puntos_calibrados = 0
         self.esquina_actual = 0
         self.tiempo_en_punto = 0
         self.tiempo_requerido_calibracion = self.configuracion.tiempo_calibracion
         self.punto_calibracion_activo = False
+        self._sello_dedo = None  # (imagen, máscara) creados al iniciar la calibración
+        self._sello_objetivo = None
         
         # Variables para confirmación de calibración
         self.esperando_confirmacion = False
@@ -190,11 +633,16 @@ class DetectorGestos:
         
         # Variables para la interfaz
         self.ultimo_gesto = TipoGesto.NINGUNO
-        self.tiempo_gesto = time.time()
+        self.tiempo_gesto = time.monotonic()
+        self._ahora = self.tiempo_gesto  # Reloj monótono leído una vez por frame en procesar_frame
+        self._ahora_ns = time.monotonic_ns()  # El mismo instante en ns enteros (clicks, botones, zoom)
         self.mostrar_interfaz = self.configuracion.mostrar_por_defecto
+        self._forma_cache = None  # (altura, ancho) con la que se calculó _layout
+        self._layout = None  # Geometría fija de la interfaz para esa resolución
         
         # Variables para doble click
         self.doble_click_ventana = self.configuracion.doble_click_ventana
+        self._doble_click_ns = int(self.doble_click_ventana * 1e9)
         
         # Variable para cambio de cámara
         self.cambiar_camara_solicitado = False
@@ -227,10 +675,24 @@ class DetectorGestos:
         logger.info(f"Detector de gestos inicializado en modo: {self.modo.value}")
     
     def _cargar_configuracion(self) -> Dict[str, Any]:
-        """Carga la configuración desde el archivo config.json"""
+        """
+        Carga la configuración desde config.json. El resultado parseado se comparte
+        entre instancias y solo se vuelve a leer si el archivo cambió (mtime).
+        """
         try:
-            with open('config.json', 'r') as f:
-                config = json.load(f)
+            mtime = Path('config.json').stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if DetectorGestos._CONFIG_CACHE is None or mtime != DetectorGestos._CONFIG_MTIME:
+            DetectorGestos._CONFIG_CACHE = self._leer_config_json()
+            DetectorGestos._CONFIG_MTIME = mtime
+        return DetectorGestos._CONFIG_CACHE
+    
+    def _leer_config_json(self) -> Dict[str, Any]:
+        """Lee y parsea config.json (con orjson si está disponible)"""
+        try:
+            datos = Path('config.json').read_bytes()
+            config = orjson.loads(datos) if orjson is not None else json.loads(datos)
             logger.info("Configuración cargada exitosamente")
             return config
         except FileNotFoundError:
@@ -273,8 +735,7 @@ class DetectorGestos:
         else:
             self.modo = ModoOperacion.PANTALLA
             # Resetear calibración al cambiar a pantalla
-            self.puntos_camara = []
-            self.puntos_proyeccion = []
+            self.n_puntos_calibrados = 0
             # Desactivar detección automática en modo pantalla
             self._detectar_proyeccion_automatica = False
             logger.info("Cambiado a modo PANTALLA (control directo)")
@@ -285,9 +746,8 @@ class DetectorGestos:
         self.area_proyeccion = None
         self.marcos_sin_deteccion = 0
         # Limpiar calibración manual previa
-        self.puntos_camara = []
-        self.puntos_proyeccion = []
-        self.matriz_transformacion = np.eye(3)
+        self.n_puntos_calibrados = 0
+        self._asignar_matriz_transformacion(np.eye(3))
         self.calibrando = False
         logger.info("🔄 Detección automática REINICIADA - Buscando proyección...")
         logger.info("💡 La detección comenzará en 3 segundos...")
@@ -306,13 +766,20 @@ class DetectorGestos:
             self.area_proyeccion = None
             
             self.calibrando = True
-            self.puntos_camara = []
-            self.puntos_proyeccion = []
+            self.n_puntos_calibrados = 0
             self.esquina_actual = 0
             self.tiempo_en_punto = 0
             self.punto_calibracion_activo = False
             self.posicion_cursor_proyeccion = None
             
+            # Indicadores de calibración pre-renderizados (se estampan cada frame)
+            if self._sello_dedo is None:
+                amarillo = (0, 255, 255)
+                self._sello_dedo = _crear_sello(
+                    ((30, amarillo, 3), (20, amarillo, 2), (10, amarillo, 1), (5, amarillo, -1)))
+                self._sello_objetivo = _crear_sello(
+                    ((40, amarillo, 3), (30, amarillo, 2), (20, amarillo, 1)))
+            
             # No definir esquinas fijas - el usuario elegirá libremente
             self.nombres_esquinas = [
                 "SUPERIOR IZQUIERDA",
@@ -337,21 +804,12 @@ class DetectorGestos:
         else:
             logger.warning("La calibración solo está disponible en modo MESA")
     
-    def _procesar_calibracion(self, frame: np.ndarray, landmarks):
-        """Procesa el estado de calibración cuando está activa"""
+    def _procesar_calibracion(self, frame: np.ndarray, puntos: np.ndarray):
+        """Procesa el estado de calibración cuando está activa (puntos: landmarks (21, 2) en píxeles)"""
         if not self.calibrando or self.esquina_actual >= 4:
             return
         
-        altura, ancho = frame.shape[:2]
-        
-        # Detectar gesto de índice extendido (mano cerrada con índice arriba)
-        puntos = []
-        for landmark in landmarks.landmark:
-            x = int(landmark.x * ancho)
-            y = int(landmark.y * altura)
-            puntos.append((x, y))
-        
-        # Verificar si es gesto de índice extendido
+        # Verificar si es gesto de índice extendido (mano cerrada con índice arriba)
         if not self._es_gesto_indice_extendido(puntos):
             # Si no es el gesto correcto, resetear
             if self.punto_calibracion_activo:
@@ -360,9 +818,7 @@ class DetectorGestos:
             return
         
         # Obtener posición del dedo índice
-        indice_tip = landmarks.landmark[8]
-        x_dedo = int(indice_tip.x * ancho)
-        y_dedo = int(indice_tip.y * altura)
+        x_dedo, y_dedo = puntos[8].tolist()
         
         # Obtener posición actual del cursor en pantalla para proyección
         cursor_actual = pyautogui.position()
@@ -376,11 +832,11 @@ class DetectorGestos:
         # Si no hay punto activo, iniciar uno nuevo
         if not self.punto_calibracion_activo:
             self.punto_calibracion_activo = True
-            self.tiempo_en_punto = time.time()
+            self.tiempo_en_punto = self._ahora
             self.posicion_cursor_proyeccion = cursor_actual
         
         # Mostrar progreso
-        tiempo_transcurrido = time.time() - self.tiempo_en_punto
+        tiempo_transcurrido = self._ahora - self.tiempo_en_punto
         progreso = min(tiempo_transcurrido / self.tiempo_requerido_calibracion, 1.0)
         
         # Dibujar barra de progreso
@@ -389,8 +845,9 @@ class DetectorGestos:
         # Si se completó el tiempo requerido
         if tiempo_transcurrido >= self.tiempo_requerido_calibracion:
             # Guardar punto de la cámara y punto de proyección
-            self.puntos_camara.append((x_dedo, y_dedo))
-            self.puntos_proyeccion.append(self.posicion_cursor_proyeccion)
+            self.puntos_camara[self.n_puntos_calibrados] = (x_dedo, y_dedo)
+            self.puntos_proyeccion[self.n_puntos_calibrados] = self.posicion_cursor_proyeccion
+            self.n_puntos_calibrados += 1
             
             logger.info(f"✓ PUNTO {self.esquina_actual + 1}/4 COMPLETADO: {self.nombres_esquinas[self.esquina_actual]}")
             
@@ -407,33 +864,34 @@ class DetectorGestos:
     
     def _dibujar_puntos_calibrados(self, frame: np.ndarray):
         """Dibuja los puntos ya calibrados y las conexiones entre ellos"""
-        if len(self.puntos_camara) < 2:
+        n = self.n_puntos_calibrados
+        if n < 2:
             return
+        puntos = [tuple(p) for p in self.puntos_camara[:n].astype(np.int32).tolist()]
         
         # Dibujar puntos calibrados
-        for i, punto in enumerate(self.puntos_camara):
+        for i, punto in enumerate(puntos):
             cv2.circle(frame, punto, 15, (0, 255, 0), -1)
             cv2.circle(frame, punto, 20, (0, 255, 0), 2)
-            cv2.putText(frame, f"{i+1}", (punto[0]-5, punto[1]+5), cv2.FONT_HERSHEY_SIMPLEX, 
+            cv2.putText(frame, f"{i+1}", (punto[0]-5, punto[1]+5), _FONT, 
                        0.6, (255, 255, 255), 2)
         
         # Dibujar líneas entre puntos consecutivos
-        for i in range(len(self.puntos_camara) - 1):
-            cv2.line(frame, self.puntos_camara[i], self.puntos_camara[i+1], (0, 255, 0), 2)
+        for i in range(n - 1):
+            cv2.line(frame, puntos[i], puntos[i+1], (0, 255, 0), 2)
         
         # Si tenemos 4 puntos, cerrar el rectángulo
-        if len(self.puntos_camara) >= 3:
-            cv2.line(frame, self.puntos_camara[0], self.puntos_camara[-1], (0, 255, 0), 2)
+        if n >= 3:
+            cv2.line(frame, puntos[0], puntos[-1], (0, 255, 0), 2)
             
         # Si tenemos 4 puntos, dibujar el rectángulo completo
-        if len(self.puntos_camara) == 4:
-            cv2.line(frame, self.puntos_camara[3], self.puntos_camara[0], (0, 255, 0), 2)
+        if n == 4:
+            cv2.line(frame, puntos[3], puntos[0], (0, 255, 0), 2)
     
     def deshacer_ultimo_punto(self):
         """Deshace el último punto calibrado"""
-        if len(self.puntos_camara) > 0 and self.calibrando:
-            punto_eliminado = self.puntos_camara.pop()
-            self.puntos_proyeccion.pop()
+        if self.n_puntos_calibrados > 0 and self.calibrando:
+            self.n_puntos_calibrados -= 1
             self.esquina_actual -= 1
             self.punto_calibracion_activo = False
             logger.info(f"Punto {self.esquina_actual + 1} eliminado. Reposiciona en: {self.nombres_esquinas[self.esquina_actual]}")
@@ -443,53 +901,14 @@ class DetectorGestos:
     def _es_gesto_indice_extendido(self, puntos) -> bool:
         """Detecta si la mano está haciendo el gesto de índice extendido"""
         try:
-            # Puntos clave de la mano
-            pulgar_tip = puntos[4]
-            pulgar_ip = puntos[3]
-            indice_tip = puntos[8]
-            indice_pip = puntos[6]
-            indice_mcp = puntos[5]
-            medio_tip = puntos[12]
-            medio_pip = puntos[10]
-            anular_tip = puntos[16]
-            anular_pip = puntos[14]
-            meñique_tip = puntos[20]
-            meñique_pip = puntos[18]
-            
-            # El índice debe estar extendido (tip más alto que pip)
-            indice_extendido = indice_tip[1] < indice_pip[1]
-            
-            # Los otros dedos deben estar doblados (tip más bajo que pip)
-            medio_doblado = medio_tip[1] > medio_pip[1]
-            anular_doblado = anular_tip[1] > anular_pip[1]
-            meñique_doblado = meñique_tip[1] > meñique_pip[1]
-            
-            return indice_extendido and medio_doblado and anular_doblado and meñique_doblado
-            
+            return indice_extendido(np.ascontiguousarray(puntos, dtype=np.float32))
         except:
             return False
     
     def _es_gesto_seleccion(self, puntos) -> bool:
         """Detecta si la mano está haciendo el gesto de selección (puño cerrado)"""
         try:
-            # Puntos clave de la mano
-            indice_tip = puntos[8]
-            indice_pip = puntos[6]
-            medio_tip = puntos[12]
-            medio_pip = puntos[10]
-            anular_tip = puntos[16]
-            anular_pip = puntos[14]
-            meñique_tip = puntos[20]
-            meñique_pip = puntos[18]
-            
-            # Todos los dedos deben estar doblados (tip más bajo que pip)
-            indice_doblado = indice_tip[1] > indice_pip[1]
-            medio_doblado = medio_tip[1] > medio_pip[1]
-            anular_doblado = anular_tip[1] > anular_pip[1]
-            meñique_doblado = meñique_tip[1] > meñique_pip[1]
-            
-            return indice_doblado and medio_doblado and anular_doblado and meñique_doblado
-            
+            return puno_cerrado(np.ascontiguousarray(puntos, dtype=np.float32))
         except:
             return False
     
@@ -499,49 +918,43 @@ class DetectorGestos:
         
         # Panel de información superior
         panel_alto = 100
-        cv2.rectangle(frame, (0, 0), (ancho, panel_alto), (0, 0, 0), -1)
-        cv2.rectangle(frame, (0, 0), (ancho, panel_alto), (0, 255, 255), 2)
+        _rectangulo_panel(frame, (0, 0), (ancho, panel_alto), (0, 0, 0), (0, 255, 255))
         
         # Título
         titulo = f"CALIBRACION - Punto {self.esquina_actual + 1}/4"
-        cv2.putText(frame, titulo, (20, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+        cv2.putText(frame, titulo, (20, 30), _FONT, 1, (0, 255, 255), 2)
         
         # Instrucciones
         esquina_nombre = self.nombres_esquinas[self.esquina_actual]
         instruccion = f"Esquina: {esquina_nombre}"
-        cv2.putText(frame, instruccion, (20, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        cv2.putText(frame, instruccion, (20, 60), _FONT, 0.8, (255, 255, 255), 2)
         
         # Información de posición
         info_pos = f"Cursor PC: {pos_cursor[0]}, {pos_cursor[1]}"
-        cv2.putText(frame, info_pos, (20, 85), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+        cv2.putText(frame, info_pos, (20, 85), _FONT, 0.6, (200, 200, 200), 1)
         
         # Indicador en posición del dedo
-        cv2.circle(frame, pos_dedo, 30, (0, 255, 255), 3)
-        cv2.circle(frame, pos_dedo, 20, (0, 255, 255), 2)
-        cv2.circle(frame, pos_dedo, 10, (0, 255, 255), 1)
-        cv2.circle(frame, pos_dedo, 5, (0, 255, 255), -1)
+        _estampar(frame, *self._sello_dedo, pos_dedo)
         
         # Número de esquina
         cv2.putText(frame, f"{self.esquina_actual + 1}", (pos_dedo[0] - 10, pos_dedo[1] + 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 255), 3)
+                   _FONT, 1.2, (0, 255, 255), 3)
     
     def _dibujar_indicador_calibracion(self, frame: np.ndarray, esquina: Tuple[int, int], numero: int):
         """Dibuja el indicador visual para la calibración"""
         x, y = esquina
         
         # Círculo grande de objetivo
-        cv2.circle(frame, (x, y), 40, (0, 255, 255), 3)
-        cv2.circle(frame, (x, y), 30, (0, 255, 255), 2)
-        cv2.circle(frame, (x, y), 20, (0, 255, 255), 1)
+        _estampar(frame, *self._sello_objetivo, (x, y))
         
         # Número de esquina
-        cv2.putText(frame, f"{numero + 1}", (x - 10, y + 10), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, f"{numero + 1}", (x - 10, y + 10), _FONT, 
                    1, (0, 255, 255), 3)
         
         # Instrucciones
         nombres_esquinas = ["Superior Izquierda", "Superior Derecha", "Inferior Derecha", "Inferior Izquierda"]
         instruccion = f"Toca esquina {nombres_esquinas[numero]} y mantén 3 segundos"
-        cv2.putText(frame, instruccion, (50, frame.shape[0] - 50), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, instruccion, (50, frame.shape[0] - 50), _FONT, 
                    0.8, (0, 255, 255), 2)
     
     def _dibujar_progreso_calibracion(self, frame: np.ndarray, esquina: Tuple[int, int], progreso: float):
@@ -552,34 +965,21 @@ class DetectorGestos:
         radio = 50
         angulo = int(360 * progreso)
         
-        # Dibujar arco de progreso
+        # Dibujar arco de progreso (empezando desde arriba, en sentido horario)
         if progreso > 0:
-            # Crear puntos para el arco
-            puntos = []
-            for i in range(0, angulo, 5):
-                rad = np.radians(i - 90)  # Empezar desde arriba
-                px = int(x + radio * np.cos(rad))
-                py = int(y + radio * np.sin(rad))
-                puntos.append((px, py))
-            
-            if len(puntos) > 1:
-                for i in range(len(puntos) - 1):
-                    cv2.line(frame, puntos[i], puntos[i + 1], (0, 255, 0), 5)
+            cv2.ellipse(frame, (x, y), (radio, radio), 0, -90, -90 + angulo,
+                        (0, 255, 0), 5, cv2.LINE_AA)
         
         # Texto de progreso
         porcentaje = int(progreso * 100)
-        cv2.putText(frame, f"{porcentaje}%", (x - 20, y - 60), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, f"{porcentaje}%", (x - 20, y - 60), _FONT, 
                    0.8, (0, 255, 0), 2)
     
     def _finalizar_calibracion(self):
         """Finaliza el proceso de calibración y calcula la matriz de transformación"""
-        if len(self.puntos_camara) >= 4 and len(self.puntos_proyeccion) >= 4:
-            # Convertir a arrays numpy
-            puntos_src = np.array(self.puntos_camara, dtype=np.float32)
-            puntos_dst = np.array(self.puntos_proyeccion, dtype=np.float32)
-            
+        if self.n_puntos_calibrados >= 4:
             # Calcular matriz de transformación
-            self.matriz_transformacion = cv2.getPerspectiveTransform(puntos_src, puntos_dst)
+            self._calcular_matriz_transformacion()
             
             self.calibrando = False
             logger.info("Calibración completada exitosamente")
@@ -589,10 +989,29 @@ class DetectorGestos:
         else:
             logger.error("Error en calibración: puntos insuficientes")
     
+    def _asignar_matriz_transformacion(self, matriz: np.ndarray, inversa: Optional[np.ndarray] = None):
+        """Guarda la matriz como float64 contigua (la que usa transformar_punto) y su inversa"""
+        self.matriz_transformacion = np.ascontiguousarray(matriz, dtype=np.float64)
+        # Los 9 coeficientes como floats de Python para transformar sin crear arrays
+        self._h = tuple(self.matriz_transformacion.ravel().tolist())
+        if inversa is None:
+            try:
+                inversa = np.linalg.inv(self.matriz_transformacion)
+            except np.linalg.LinAlgError:
+                logger.warning("Matriz de calibración singular - sin mapeo inverso")
+                inversa = np.eye(3)
+        self.matriz_inversa = np.ascontiguousarray(inversa, dtype=np.float64)
+    
+    def _calcular_matriz_transformacion(self):
+        """Calcula la homografía cámara -> proyección a partir de los puntos de calibración"""
+        self._asignar_matriz_transformacion(
+            cv2.getPerspectiveTransform(self.puntos_camara, self.puntos_proyeccion))
+    
     def _guardar_calibracion(self):
-        """Guarda la matriz de calibración a un archivo"""
+        """Guarda la matriz de calibración y su inversa en un único archivo"""
         try:
-            np.save('calibracion_matriz.npy', self.matriz_transformacion)
+            np.savez('calibracion_matriz.npz',
+                     matriz=self.matriz_transformacion, inversa=self.matriz_inversa)
             logger.info("Matriz de calibración guardada")
         except Exception as e:
             logger.error(f"Error guardando calibración: {e}")
@@ -600,8 +1019,14 @@ class DetectorGestos:
     def _cargar_calibracion(self):
         """Carga una calibración previamente guardada"""
         try:
+            if Path('calibracion_matriz.npz').exists():
+                with np.load('calibracion_matriz.npz') as datos:
+                    self._asignar_matriz_transformacion(datos['matriz'], datos['inversa'])
+                logger.info("Calibración cargada desde archivo")
+                return True
             if Path('calibracion_matriz.npy').exists():
-                self.matriz_transformacion = np.load('calibracion_matriz.npy')
+                # Formato anterior: solo la matriz directa
+                self._asignar_matriz_transformacion(np.load('calibracion_matriz.npy'))
                 logger.info("Calibración cargada desde archivo")
                 return True
         except Exception as e:
@@ -737,6 +1162,8 @@ class DetectorGestos:
             vertices.astype(np.float32), 
             puntos_destino
         )
+        # Los 9 coeficientes como floats de Python para transformar sin crear arrays
+        self._hp = tuple(self.matriz_perspectiva.ravel().tolist())
         
         logger.debug(f"✓ Matriz de perspectiva calculada para corrección de ángulo")
     
@@ -749,13 +1176,14 @@ class DetectorGestos:
         if self.matriz_perspectiva is None:
             return x, y
         
-        # Convertir punto a formato homogéneo
-        punto = np.array([[[x, y]]], dtype=np.float32)
-        
-        # Aplicar transformación
-        punto_transformado = cv2.perspectiveTransform(punto, self.matriz_perspectiva)
-        
-        return int(punto_transformado[0][0][0]), int(punto_transformado[0][0][1])
+        # Aritmética escalar con los coeficientes cacheados (sin arrays por punto)
+        h0, h1, h2, h3, h4, h5, h6, h7, h8 = self._hp
+        u = h0 * x + h1 * y + h2
+        v = h3 * x + h4 * y + h5
+        w = h6 * x + h7 * y + h8
+        if w == 0.0:
+            return 0, 0  # Punto en el infinito (cv2.perspectiveTransform devuelve 0)
+        return int(u / w), int(v / w)
     
     def _dibujar_area_proyeccion(self, frame: np.ndarray):
         """Dibuja el área de proyección detectada (cuadrilátero real + margen de tolerancia)"""
@@ -776,12 +1204,12 @@ class DetectorGestos:
                 for i, (punto, label, color) in enumerate(zip(vertices, labels, colors)):
                     cv2.circle(frame, tuple(punto), 8, color, -1)
                     cv2.putText(frame, label, tuple(punto + 10), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+                              _FONT, 0.5, color, 2)
                 
                 # Información sobre corrección de perspectiva
                 if hasattr(self, 'matriz_perspectiva') and self.matriz_perspectiva is not None:
                     cv2.putText(frame, "PERSPECTIVA CORREGIDA", (x, y - 35), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+                              _FONT, 0.6, (255, 255, 0), 2)
             else:
                 # Fallback: dibujar rectángulo simple
                 cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 3)
@@ -806,7 +1234,7 @@ class DetectorGestos:
             
             # Texto informativo
             cv2.putText(frame, f"AREA PROYECCION (Margen: {margen}px)", (x, y - 10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                       _FONT, 0.7, (0, 255, 0), 2)
     
     def _punto_dentro_proyeccion(self, x: int, y: int) -> bool:
         """Verifica si un punto está dentro del área de proyección detectada (con margen)"""
@@ -854,9 +1282,9 @@ class DetectorGestos:
         norm_x = max(0.0, min(1.0, norm_x))
         norm_y = max(0.0, min(1.0, norm_y))
         
-        # Mapear a coordenadas de pantalla
-        screen_x = int(norm_x * pyautogui.size().width)
-        screen_y = int(norm_y * pyautogui.size().height)
+        # Mapear a coordenadas de pantalla (tamaño leído una vez en __init__)
+        screen_x = int(norm_x * self.ancho_pantalla)
+        screen_y = int(norm_y * self.alto_pantalla)
         
         return screen_x, screen_y
     
@@ -869,7 +1297,7 @@ class DetectorGestos:
             x, y, w, h = self.area_proyeccion
             
             # Definir puntos de la cámara (área detectada)
-            self.puntos_camara = [
+            self.puntos_camara[:] = [
                 (x, y),          # Superior izquierda
                 (x + w, y),      # Superior derecha  
                 (x + w, y + h),  # Inferior derecha
@@ -878,12 +1306,13 @@ class DetectorGestos:
             
             # Definir puntos de proyección (pantalla completa)
             screen_width, screen_height = pyautogui.size()
-            self.puntos_proyeccion = [
+            self.puntos_proyeccion[:] = [
                 (0, 0),                              # Superior izquierda
                 (screen_width, 0),                   # Superior derecha
                 (screen_width, screen_height),       # Inferior derecha
                 (0, screen_height)                   # Inferior izquierda
             ]
+            self.n_puntos_calibrados = 4
             
             # Calcular matriz de transformación
             self._calcular_matriz_transformacion()
@@ -893,40 +1322,29 @@ class DetectorGestos:
         except Exception as e:
             logger.error(f"Error configurando transformación automática: {e}")
     
-    def _calcular_tamaño_mano(self, landmarks, frame_shape) -> float:
+    def _calcular_tamaño_mano(self, pts_px: np.ndarray) -> float:
         """Calcula el tamaño de la mano basado en la distancia entre puntos clave"""
         try:
-            altura, ancho = frame_shape[:2]
-            
-            # Convertir landmarks a coordenadas
-            puntos = []
-            for landmark in landmarks.landmark:
-                x = int(landmark.x * ancho)
-                y = int(landmark.y * altura)
-                puntos.append((x, y))
-            
-            # Calcular distancia entre muñeca y dedo medio
-            muneca = puntos[0]  # Wrist
-            medio_tip = puntos[12]  # Middle finger tip
-            
-            distancia = np.sqrt((muneca[0] - medio_tip[0])**2 + (muneca[1] - medio_tip[1])**2)
-            return distancia
+            # Distancia entre muñeca (0) y punta del dedo medio (12)
+            return sqrt(distancia2_landmarks(pts_px, 0, 12))
             
         except Exception as e:
             logger.error(f"Error calculando tamaño de mano: {e}")
             return 100.0  # Valor por defecto
     
-    def _calibrar_distancia_automatica(self, landmarks, frame_shape):
+    def _calibrar_distancia_automatica(self, pts_px: np.ndarray):
         """Calibra automáticamente la distancia basada en el tamaño de la mano"""
-        tamaño_actual = self._calcular_tamaño_mano(landmarks, frame_shape)
+        tamaño_actual = self._calcular_tamaño_mano(pts_px)
         
-        # Agregar al historial (máximo 10 mediciones)
-        self.historial_tamaños_mano.append(tamaño_actual)
-        if len(self.historial_tamaños_mano) > 10:
-            self.historial_tamaños_mano.pop(0)
+        # Agregar al historial (máximo 10 mediciones) manteniendo la suma acumulada
+        historial = self.historial_tamaños_mano
+        if len(historial) == historial.maxlen:
+            self._suma_tamaños_mano -= historial[0]
+        historial.append(tamaño_actual)
+        self._suma_tamaños_mano += tamaño_actual
         
         # Calcular tamaño promedio
-        tamaño_promedio = sum(self.historial_tamaños_mano) / len(self.historial_tamaños_mano)
+        tamaño_promedio = self._suma_tamaños_mano / len(historial)
         
         # Si es la primera vez, establecer como referencia
         if self.tamaño_mano_referencia is None:
@@ -946,17 +1364,21 @@ class DetectorGestos:
             if self.factor_distancia < 0.5:
                 # MUY lejos (< 50% del tamaño de referencia) - prácticamente desactivar gestos
                 self.distancia_pinza_adaptativa = 5  # Casi imposible de activar
-                logger.debug(f"⚠️ Mano MUY lejos (factor {self.factor_distancia:.2f}) - gestos casi desactivados")
+                logger.debug("⚠️ Mano MUY lejos (factor %.2f) - gestos casi desactivados", self.factor_distancia)
             elif self.factor_distancia < 0.7:
                 # Lejos (50-70% del tamaño) - muy restrictivo
                 self.distancia_pinza_adaptativa = max(self.distancia_pinza_adaptativa, 80)
-                logger.debug(f"⚠️ Mano lejos (factor {self.factor_distancia:.2f}) - umbral alto: {self.distancia_pinza_adaptativa:.0f}px")
+                logger.debug("⚠️ Mano lejos (factor %.2f) - umbral alto: %.0fpx",
+                             self.factor_distancia, self.distancia_pinza_adaptativa)
             elif self.factor_distancia < 0.9:
                 # Medio lejos (70-90%) - restrictivo
                 self.distancia_pinza_adaptativa = max(self.distancia_pinza_adaptativa, 50)
             else:
                 # Cerca (> 90%) - normal con límites razonables
                 self.distancia_pinza_adaptativa = max(20, min(80, self.distancia_pinza_adaptativa))
+            
+            # Los gestos comparan distancias al cuadrado: elevar el umbral una sola vez
+            self._pinza_umbral_sq = float(self.distancia_pinza_adaptativa) ** 2
     
     def _mostrar_deteccion_automatica(self, frame: np.ndarray):
         """Implementar rectángulos en esquinas para detección automática (modo backup)"""
@@ -969,27 +1391,116 @@ class DetectorGestos:
         
         # Rectángulo superior izquierda
         cv2.rectangle(frame, (20, 20), (20 + rect_size, 20 + rect_size), color, thickness)
-        cv2.putText(frame, "1", (35, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        cv2.putText(frame, "1", (35, 50), _FONT, 1, color, 2)
         
         # Rectángulo superior derecha
         cv2.rectangle(frame, (ancho - 70, 20), (ancho - 20, 20 + rect_size), color, thickness)
-        cv2.putText(frame, "2", (ancho - 55, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        cv2.putText(frame, "2", (ancho - 55, 50), _FONT, 1, color, 2)
         
         # Rectángulo inferior derecha
         cv2.rectangle(frame, (ancho - 70, altura - 70), (ancho - 20, altura - 20), color, thickness)
-        cv2.putText(frame, "3", (ancho - 55, altura - 35), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        cv2.putText(frame, "3", (ancho - 55, altura - 35), _FONT, 1, color, 2)
         
         # Rectángulo inferior izquierda
         cv2.rectangle(frame, (20, altura - 70), (20 + rect_size, altura - 20), color, thickness)
-        cv2.putText(frame, "4", (35, altura - 35), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        cv2.putText(frame, "4", (35, altura - 35), _FONT, 1, color, 2)
         
         # Texto informativo
         cv2.putText(frame, "MODO DETECCION: Apunta a rectangulos 1-2-3-4", 
-                   (ancho//2 - 200, altura - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                   (ancho//2 - 200, altura - 10), _FONT, 0.6, color, 2)
+    
+    def _actualizar_layout(self, frame: np.ndarray):
+        """Recalcula la geometría fija de la interfaz solo si cambia la resolución"""
+        forma = frame.shape[:2]
+        if forma == self._forma_cache:
+            return
+        
+        altura, ancho = forma
+        panel_x = ancho - 320  # Panel lateral derecho
+        simple_x = ancho - 280  # Panel de controles de teclado
+        simple_y = 50
+        
+        # Panel de controles de teclado: es estático, así que se rasteriza una vez
+        # en un lienzo del tamaño del frame y se guarda el recorte que ocupa
+        lienzo = np.zeros((altura, ancho, 3), dtype=np.uint8)
+        esquina_1, esquina_2 = (simple_x, simple_y), (ancho, simple_y + 180)
+        cv2.rectangle(lienzo, esquina_1, esquina_2, (30, 30, 30), -1)
+        cv2.rectangle(lienzo, esquina_1, esquina_2, (100, 100, 100), 2)
+        cv2.putText(lienzo, "CONTROLES DE TECLADO:", (simple_x + 15, simple_y + 30),
+                    _FONT, 0.6, (255, 255, 255), 2)
+        y_pos = simple_y + 55
+        for control in self._CONTROLES_TECLADO:
+            cv2.putText(lienzo, control, (simple_x + 15, y_pos),
+                        _FONT, 0.45, (200, 200, 200), 1)
+            y_pos += 15
+        # Botones de confirmación de calibración: (x0, y0, x1, y1), compartidos por
+        # el dibujo y la detección del dedo
+        y_botones = altura - 80
+        espacio_boton = (ancho - 40) // 3
+        botones = tuple(
+            (20 + i * espacio_boton, y_botones - 25, 20 + (i + 1) * espacio_boton - 10, y_botones + 15)
+            for i in range(3)
+        )
+        
+        # El borde de grosor 2 sobresale 1 px del rectángulo; la máscara excluye
+        # los píxeles de las esquinas exteriores que el borde no pinta
+        filas = slice(max(0, simple_y - 1), min(altura, simple_y + 182))
+        columnas = slice(max(0, simple_x - 1), ancho)
+        ayuda = lienzo[filas, columnas].copy()
+        ayuda_mascara = ayuda.any(axis=2, keepdims=True)
+        
+        # Barra superior y panel lateral: fondo, borde, título y separador son fijos
+        lienzo[:] = 0
+        cv2.rectangle(lienzo, (0, 0), (ancho, 40), (30, 30, 30), -1)
+        cv2.rectangle(lienzo, (0, 0), (ancho, 40), (80, 80, 80), 1)
+        barra = lienzo[:41].copy()
+        
+        lienzo[:] = 0
+        cv2.rectangle(lienzo, (panel_x, 0), (ancho, altura), (25, 25, 25), -1)
+        cv2.rectangle(lienzo, (panel_x, 0), (ancho, altura), (80, 80, 80), 2)
+        cv2.putText(lienzo, "DETECTOR GESTOS v3.0", (panel_x + 10, 30),
+                    _FONT, 0.7, (255, 255, 255), 2)
+        cv2.line(lienzo, (panel_x + 10, 40), (ancho - 10, 40), (100, 100, 100), 1)
+        panel_columnas = slice(max(0, panel_x - 1), ancho)
+        panel = lienzo[:, panel_columnas].copy()
+        
+        # Variante del panel por modo con las líneas que no cambian dentro de la sesión
+        # (etiqueta del modo, resolución de pantalla y cabecera de calibración)
+        texto_x = panel_x + 15 - panel_columnas.start
+        paneles_modo = {}
+        for modo in ModoOperacion:
+            variante = panel.copy()
+            cv2.putText(variante, _ETIQUETAS_MODO[modo], (texto_x, 100),
+                        _FONT, 0.6, (100, 200, 255), 1)
+            cv2.putText(variante, f"Pantalla: {self.ancho_pantalla}x{self.alto_pantalla}", (texto_x, 175),
+                        _FONT, 0.5, (200, 200, 200), 1)
+            if modo == ModoOperacion.MESA:
+                cv2.putText(variante, "CALIBRACION:", (texto_x, 210),
+                            _FONT, 0.6, (255, 200, 0), 2)
+            paneles_modo[modo] = variante
+        
+        self._layout = {
+            'ancho': ancho,
+            'altura': altura,
+            'barra': barra,
+            'estado_cal': (ancho - 200, 25),
+            'panel_x': panel_x,
+            'texto_x': panel_x + 15,
+            'panel_columnas': panel_columnas,
+            'panel': panel,
+            'panel_mascara': panel.any(axis=2, keepdims=True),
+            'paneles_modo': paneles_modo,
+            'listas_panel': {},  # y de "CONTROLES:" -> (filas, recorte, máscara)
+            'ayuda_region': (filas, columnas),
+            'ayuda': ayuda,
+            'ayuda_mascara': ayuda_mascara,
+            'botones_confirmacion': botones,
+        }
+        self._forma_cache = forma
     
     def dibujar_interfaz_principal(self, frame: np.ndarray) -> np.ndarray:
         """Dibuja la interfaz principal del sistema"""
-        altura, ancho = frame.shape[:2]
+        self._actualizar_layout(frame)
         
         # Solo dibujar la información básica, sin botones falsos
         self._dibujar_informacion_sistema(frame)
@@ -1001,21 +1512,19 @@ class DetectorGestos:
     
     def _dibujar_informacion_sistema(self, frame: np.ndarray):
         """Dibuja información básica del sistema sin botones falsos"""
-        altura, ancho = frame.shape[:2]
-        barra_alto = 40
+        layout = self._layout
         
-        # Fondo simple para información
-        cv2.rectangle(frame, (0, 0), (ancho, barra_alto), (30, 30, 30), -1)
-        cv2.rectangle(frame, (0, 0), (ancho, barra_alto), (80, 80, 80), 1)
+        # Fondo simple para información (pre-renderizado)
+        frame[:41] = layout['barra']
         
         # Información básica del sistema
-        info_texto = f"Detector de Gestos v3.0 - {self.modo.value.title()}"
-        cv2.putText(frame, info_texto, (10, 25), cv2.FONT_HERSHEY_SIMPLEX, 
+        info_texto = _TITULOS_MODO[self.modo]
+        cv2.putText(frame, info_texto, (10, 25), _FONT, 
                    0.7, (255, 255, 255), 2)
         
-        # Estado de calibración si aplica
-        if self.modo == ModoOperacion.MESA:
-            puntos_cal = len(self.puntos_camara)
+        # Estado de calibración si aplica (el panel lateral lo taparía)
+        if self.modo == ModoOperacion.MESA and not self.mostrar_interfaz:
+            puntos_cal = self.n_puntos_calibrados
             if puntos_cal >= 4:
                 estado_cal = "Calibrado ✓"
                 color_cal = (0, 255, 0)
@@ -1023,61 +1532,38 @@ class DetectorGestos:
                 estado_cal = f"Sin calibrar ({puntos_cal}/4)"
                 color_cal = (255, 100, 0)
             
-            cv2.putText(frame, estado_cal, (ancho - 200, 25), cv2.FONT_HERSHEY_SIMPLEX, 
+            cv2.putText(frame, estado_cal, layout['estado_cal'], _FONT, 
                        0.6, color_cal, 2)
     
     def _dibujar_interfaz_completa(self, frame: np.ndarray):
         """Dibuja la interfaz completa con información detallada en panel lateral derecho"""
-        altura, ancho = frame.shape[:2]
+        layout = self._layout
         
         # 📊 PANEL LATERAL DERECHO REORGANIZADO
-        panel_ancho = 320
-        panel_x = ancho - panel_ancho
-        
-        # Fondo del panel derecho completo
-        cv2.rectangle(frame, (panel_x, 0), (ancho, altura), (25, 25, 25), -1)
-        cv2.rectangle(frame, (panel_x, 0), (ancho, altura), (80, 80, 80), 2)
-        
-        # Título principal
-        y_pos = 30
-        cv2.putText(frame, "DETECTOR GESTOS v3.0", (panel_x + 10, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # Separador
-        y_pos += 10
-        cv2.line(frame, (panel_x + 10, y_pos), (ancho - 10, y_pos), (100, 100, 100), 1)
+        texto_x = layout['texto_x']
         
-        # INFORMACIÓN DEL SISTEMA
-        y_pos += 30
+        # Fondo, título, separador y líneas fijas del modo (pre-renderizados)
+        columnas = layout['panel_columnas']
+        np.copyto(frame[:, columnas], layout['paneles_modo'][self.modo], where=layout['panel_mascara'])
         
-        # INFORMACIÓN DEL SISTEMA
-        y_pos += 30
-        cv2.putText(frame, f"Modo: {self.modo.value.upper()}", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (100, 200, 255), 1)
+        # INFORMACIÓN DEL SISTEMA (la etiqueta del modo va en el panel pre-renderizado)
+        y_pos = 125
+        cv2.putText(frame, _ETIQUETAS_GESTO[self.ultimo_gesto], (texto_x, y_pos), 
+                   _FONT, 0.6, (255, 255, 255), 1)
         
         y_pos += 25
-        gesto_texto = self.ultimo_gesto.value.replace('_', ' ').title()
-        cv2.putText(frame, f"Gesto: {gesto_texto}", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        cv2.putText(frame, f"Cursor: ({self.cursor_x}, {self.cursor_y})", (texto_x, y_pos), 
+                   _FONT, 0.5, (200, 200, 200), 1)
         
+        # "Pantalla: ..." (y = 175) también está pre-renderizada
         y_pos += 25
-        cv2.putText(frame, f"Cursor: ({self.cursor_x}, {self.cursor_y})", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
         
-        y_pos += 25
-        cv2.putText(frame, f"Pantalla: {self.ancho_pantalla}x{self.alto_pantalla}", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-        
-        # INFORMACIÓN DE CALIBRACIÓN (MODO MESA)
+        # INFORMACIÓN DE CALIBRACIÓN (MODO MESA; la cabecera está pre-renderizada)
         if self.modo == ModoOperacion.MESA:
-            y_pos += 35
-            cv2.putText(frame, "CALIBRACION:", (panel_x + 15, y_pos), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 200, 0), 2)
-            
-            y_pos += 25
-            puntos_cal = len(self.puntos_camara)
-            cv2.putText(frame, f"Manual: {puntos_cal}/4 puntos", (panel_x + 15, y_pos), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 200, 0), 1)
+            y_pos += 35 + 25
+            puntos_cal = self.n_puntos_calibrados
+            cv2.putText(frame, f"Manual: {puntos_cal}/4 puntos", (texto_x, y_pos), 
+                       _FONT, 0.5, (255, 200, 0), 1)
             
             # Estado de detección automática
             y_pos += 20
@@ -1093,110 +1579,70 @@ class DetectorGestos:
                 estado_auto = "Auto: DESACTIVADO"
                 color_auto = (100, 100, 100)
             
-            cv2.putText(frame, estado_auto, (panel_x + 15, y_pos), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, color_auto, 1)
+            cv2.putText(frame, estado_auto, (texto_x, y_pos), 
+                       _FONT, 0.5, color_auto, 1)
             
             # Información de calibración automática de distancia
             if hasattr(self, 'factor_distancia') and self.factor_distancia:
                 y_pos += 20
                 color_factor = (0, 255, 0) if 0.8 <= self.factor_distancia <= 1.2 else (255, 100, 0)
-                cv2.putText(frame, f"Distancia: {self.factor_distancia:.2f}x", (panel_x + 15, y_pos), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, color_factor, 1)
+                cv2.putText(frame, f"Distancia: {self.factor_distancia:.2f}x", (texto_x, y_pos), 
+                           _FONT, 0.5, color_factor, 1)
                 y_pos += 20
-                cv2.putText(frame, f"Umbral: {int(self.distancia_pinza_adaptativa)}px", (panel_x + 15, y_pos), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, color_factor, 1)
+                cv2.putText(frame, f"Umbral: {int(self.distancia_pinza_adaptativa)}px", (texto_x, y_pos), 
+                           _FONT, 0.5, color_factor, 1)
             
             # Información del margen de área
             if hasattr(self, 'MARGEN_AREA'):
                 y_pos += 20
-                cv2.putText(frame, f"Margen: {self.MARGEN_AREA}px", (panel_x + 15, y_pos), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 200, 255), 1)
+                cv2.putText(frame, f"Margen: {self.MARGEN_AREA}px", (texto_x, y_pos), 
+                           _FONT, 0.5, (100, 200, 255), 1)
         
-        # CONTROLES DE TECLADO
+        # CONTROLES DE TECLADO y GESTOS DISPONIBLES (texto fijo pre-renderizado)
         y_pos += 45
-        cv2.putText(frame, "CONTROLES:", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        
-        controles = [
-            "ESC/Q - Salir",
-            "V - Mostrar/Ocultar UI", 
-            "M - Modo (Pantalla/Mesa)",
-            "K - Cambiar camara",
-            "C - Calibracion manual",
-            "A - Deteccion automatica",
-            "R - Reset sistema",
-            "+/- - Ajustar margen (Mesa)"
-        ]
+        filas, listas, mascara = self._listas_panel(y_pos)
+        np.copyto(frame[filas, columnas], listas, where=mascara)
         
+        # Panel lateral con controles
+        self._dibujar_panel_controles_simple(frame)
+    
+    def _listas_panel(self, y_pos: int) -> Tuple[slice, np.ndarray, np.ndarray]:
+        """
+        Rasteriza una vez por posición las listas de controles y gestos sobre el
+        fondo del panel y devuelve las filas que ocupan, el recorte y su máscara.
+        """
+        layout = self._layout
+        cache = layout['listas_panel']
+        if y_pos in cache:
+            return cache[y_pos]
+        clave = y_pos
+        
+        fondo = layout['panel']
+        lienzo = fondo.copy()
+        texto_x = layout['texto_x'] - layout['panel_columnas'].start
+        cv2.putText(lienzo, "CONTROLES:", (texto_x, y_pos), _FONT, 0.6, (255, 255, 255), 2)
         y_pos += 25
-        for control in controles:
-            cv2.putText(frame, control, (panel_x + 15, y_pos), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
+        for control in self._CONTROLES_PANEL:
+            cv2.putText(lienzo, control, (texto_x, y_pos), _FONT, 0.4, (200, 200, 200), 1)
             y_pos += 18
-        
-        # GESTOS DISPONIBLES
         y_pos += 15
-        cv2.putText(frame, "GESTOS:", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        
-        gestos = [
-            "🖐️ Mano abierta - Cursor",
-            "👌 Pulgar+Indice - Click L",
-            "🤏 Pulgar+Medio - Click R", 
-            "⚡ Doble pinza - Doble click",
-            "👊👊 Dos manos - Zoom"
-        ]
-        
+        cv2.putText(lienzo, "GESTOS:", (texto_x, y_pos), _FONT, 0.6, (255, 255, 255), 2)
         y_pos += 25
-        for gesto in gestos:
-            cv2.putText(frame, gesto, (panel_x + 15, y_pos), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (150, 255, 150), 1)
+        for gesto in self._GESTOS_PANEL:
+            cv2.putText(lienzo, gesto, (texto_x, y_pos), _FONT, 0.4, (150, 255, 150), 1)
             y_pos += 18
         
-        # Panel lateral con controles
-        self._dibujar_panel_controles_simple(frame)
+        # Solo los píxeles que el texto cambió, recortados a las filas que ocupa
+        mascara = (lienzo != fondo).any(axis=2, keepdims=True)
+        ocupadas = np.flatnonzero(mascara.any(axis=1))
+        filas = slice(ocupadas[0], ocupadas[-1] + 1) if ocupadas.size else slice(0, 0)
+        cache[clave] = entrada = (filas, lienzo[filas].copy(), mascara[filas].copy())
+        return entrada
     
     def _dibujar_panel_controles_simple(self, frame: np.ndarray):
-        """Dibuja un panel de controles simplificado"""
-        altura, ancho = frame.shape[:2]
-        panel_ancho = 280
-        panel_x = ancho - panel_ancho
-        panel_y = 50
-        panel_alto = 180
-        
-        # Fondo del panel
-        cv2.rectangle(frame, (panel_x, panel_y), (ancho, panel_y + panel_alto), (30, 30, 30), -1)
-        cv2.rectangle(frame, (panel_x, panel_y), (ancho, panel_y + panel_alto), (100, 100, 100), 2)
-        
-        # Título
-        y_pos = panel_y + 30
-        cv2.putText(frame, "CONTROLES DE TECLADO:", (panel_x + 15, y_pos), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        
-        # Lista de controles
-        controles = [
-            "ESC/Q - Salir del programa",
-            "V - Mostrar/Ocultar interfaz", 
-            "M - Cambiar modo (Pantalla/Mesa)",
-            "K - Cambiar camara",
-            "C - Calibracion manual (modo mesa)",
-            "A - Deteccion automatica (modo mesa)",
-            "R - Reset calibracion/zoom",
-            "",
-        ]
-        
-        y_pos += 25
-        for control in controles:
-            if control == "":
-                y_pos += 10
-                continue
-            elif control.startswith("GESTOS"):
-                cv2.putText(frame, control, (panel_x + 15, y_pos), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            else:
-                cv2.putText(frame, control, (panel_x + 15, y_pos), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.45, (200, 200, 200), 1)
-            y_pos += 15
+        """Dibuja un panel de controles simplificado (copiando el panel pre-renderizado)"""
+        filas, columnas = self._layout['ayuda_region']
+        np.copyto(frame[filas, columnas], self._layout['ayuda'], where=self._layout['ayuda_mascara'])
     
     def _dibujar_panel_controles(self, frame: np.ndarray):
         """Dibuja el panel de controles lateral"""
@@ -1205,36 +1651,35 @@ class DetectorGestos:
         panel_x = ancho - panel_ancho
         
         # Fondo del panel
-        cv2.rectangle(frame, (panel_x, 0), (ancho, altura), (0, 0, 0), -1)
-        cv2.rectangle(frame, (panel_x, 0), (ancho, altura), self.configuracion.color_primario, 2)
+        _rectangulo_panel(frame, (panel_x, 0), (ancho, altura), (0, 0, 0), self.configuracion.color_primario)
         
         # Información del sistema
         y_pos = 30
-        cv2.putText(frame, "CONTROLES", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, "CONTROLES", (panel_x + 10, y_pos), _FONT, 
                    0.7, self.configuracion.color_secundario, 2)
         
         y_pos += 40
-        cv2.putText(frame, "V - Alternar interfaz", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, "V - Alternar interfaz", (panel_x + 10, y_pos), _FONT, 
                    0.5, (255, 255, 255), 1)
         
         y_pos += 25
-        cv2.putText(frame, "ESC - Salir", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, "ESC - Salir", (panel_x + 10, y_pos), _FONT, 
                    0.5, (255, 255, 255), 1)
         
         # Información de calibración
         if self.modo == ModoOperacion.MESA:
             y_pos += 50
-            cv2.putText(frame, "CALIBRACION", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+            cv2.putText(frame, "CALIBRACION", (panel_x + 10, y_pos), _FONT, 
                        0.7, self.configuracion.color_secundario, 2)
             
             y_pos += 30
-            puntos_cal = len(self.puntos_camara)
-            cv2.putText(frame, f"Puntos: {puntos_cal}/4", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+            puntos_cal = self.n_puntos_calibrados
+            cv2.putText(frame, f"Puntos: {puntos_cal}/4", (panel_x + 10, y_pos), _FONT, 
                        0.5, (255, 255, 255), 1)
             
             if puntos_cal < 4:
                 y_pos += 25
-                cv2.putText(frame, "Toca las esquinas", (panel_x + 10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+                cv2.putText(frame, "Toca las esquinas", (panel_x + 10, y_pos), _FONT, 
                            0.5, self.configuracion.color_error, 1)
     
     def _dibujar_panel_gestos(self, frame: np.ndarray):
@@ -1244,21 +1689,169 @@ class DetectorGestos:
         panel_y = altura - panel_alto
         
         # Fondo del panel
-        cv2.rectangle(frame, (0, panel_y), (ancho - 300, altura), (0, 0, 0), -1)
-        cv2.rectangle(frame, (0, panel_y), (ancho - 300, altura), self.configuracion.color_primario, 2)
+        _rectangulo_panel(frame, (0, panel_y), (ancho - 300, altura), (0, 0, 0), self.configuracion.color_primario)
         
         # Información de gestos
         y_pos = panel_y + 30
-        cv2.putText(frame, "GESTOS DISPONIBLES", (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, "GESTOS DISPONIBLES", (10, y_pos), _FONT, 
                    0.7, self.configuracion.color_secundario, 2)
         
         y_pos += 30
         cv2.putText(frame, "✋ Mano abierta: Cursor | 👌 Pulgar+Indice: Click/Arrastrar | 🤏 Pulgar+Medio: Click derecho", 
-                   (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                   (10, y_pos), _FONT, 0.5, (255, 255, 255), 1)
         
         y_pos += 25
         cv2.putText(frame, f"👊 Dos puños: Zoom | Doble click: {self.doble_click_ventana}s", 
-                   (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                   (10, y_pos), _FONT, 0.5, (255, 255, 255), 1)
+    
+    def _recortar_roi(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Tuple[float, float, float, float]]]:
+        """
+        Recorta el frame a la ROI de las manos del frame anterior.
+        
+        Devuelve la vista recortada y la ROI ajustada a píxeles como
+        (x0, y0, ancho, alto) normalizados, o el frame completo y None.
+        """
+        if self._roi_previo is None or self._inferencias_con_roi >= self._REDETECCION_CADA:
+            self._inferencias_con_roi = 0
+            return frame, None
+        self._inferencias_con_roi += 1
+        
+        altura, ancho = frame.shape[:2]
+        x0, y0, x1, y1 = self._roi_previo
+        px0, py0 = int(x0 * ancho), int(y0 * altura)
+        px1, py1 = int(x1 * ancho + 0.5), int(y1 * altura + 0.5)
+        if px1 - px0 < 32 or py1 - py0 < 32:
+            return frame, None
+        
+        roi = (px0 / ancho, py0 / altura, (px1 - px0) / ancho, (py1 - py0) / altura)
+        return frame[py0:py1, px0:px1], roi
+    
+    def _detectar_manos(self, rgb: np.ndarray, roi=None):
+        """Ejecuta MediaPipe y, si la entrada era un recorte, lleva los landmarks al frame completo"""
+        resultados = self.hands.process(rgb)
+        if roi is not None and resultados.multi_hand_landmarks:
+            rx, ry, rw, rh = roi
+            for mano in resultados.multi_hand_landmarks:
+                for lm in mano.landmark:
+                    lm.x = rx + lm.x * rw
+                    lm.y = ry + lm.y * rh
+        return resultados
+    
+    def _calcular_roi(self, resultados) -> Optional[Tuple[float, float, float, float]]:
+        """Caja normalizada de las manos detectadas con margen, o None para inferir en el frame completo"""
+        if not self.configuracion.recorte_roi or not resultados.multi_hand_landmarks:
+            return None
+        
+        # Mientras falten manos por seguir (p. ej. la segunda del zoom) se infiere en el
+        # frame completo: una mano que entra fuera del recorte no se vería
+        if len(resultados.multi_hand_landmarks) < self.configuracion.max_num_hands:
+            return None
+        
+        # Con baja confianza en alguna mano se vuelve a buscar en todo el frame
+        if resultados.multi_handedness and min(
+                mano.classification[0].score for mano in resultados.multi_handedness
+        ) < self._CONFIANZA_MIN_ROI:
+            return None
+        
+        xs = [lm.x for mano in resultados.multi_hand_landmarks for lm in mano.landmark]
+        ys = [lm.y for mano in resultados.multi_hand_landmarks for lm in mano.landmark]
+        x0, x1, y0, y1 = min(xs), max(xs), min(ys), max(ys)
+        margen_x = (x1 - x0) * self._MARGEN_ROI
+        margen_y = (y1 - y0) * self._MARGEN_ROI
+        x0, x1 = max(0.0, x0 - margen_x), min(1.0, x1 + margen_x)
+        y0, y1 = max(0.0, y0 - margen_y), min(1.0, y1 + margen_y)
+        
+        # Si la caja cubre casi todo el frame, recortar no ahorra nada
+        if (x1 - x0) * (y1 - y0) > self._AREA_MAX_ROI:
+            return None
+        return (x0, y0, x1, y1)
+    
+    def _inferir_en_segundo_plano(self, rgb: np.ndarray, roi=None):
+        """
+        Encola la inferencia de este frame y devuelve la del frame anterior.
+        
+        MediaPipe libera el GIL durante la inferencia, así que el dibujo del frame
+        actual se solapa con la detección del siguiente (un frame de latencia).
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inferencia')
+        
+        # Sin copia: _preparar_entrada alterna dos buffers y, antes de reescribir
+        # uno, ya se esperó aquí la inferencia que lo leía
+        anterior = self._futuro_inferencia
+        self._futuro_inferencia = self._pool.submit(self._detectar_manos, rgb, roi)
+        if anterior is None:
+            return self._futuro_inferencia.result()  # Primer frame: esperar
+        return anterior.result()
+    
+    def _debe_inferir(self, ahora: float) -> bool:
+        """Decide si este frame pasa por MediaPipe o reutiliza los últimos landmarks"""
+        if self._ultimos_resultados is None:
+            return True
+        
+        # Limitar la tasa de inferencia si está configurado
+        fps_max = self.configuracion.fps_inferencia_max
+        if fps_max > 0 and ahora - self._tiempo_ultima_inferencia < 1.0 / fps_max:
+            return False
+        
+        # Cada frame mientras se arrastra, calibra o hay un gesto de acción en curso
+        # (click, zoom); en reposo, según cuánto se movieron las manos
+        if (self.arrastrando or self.calibrando or self.esperando_confirmacion or
+                self.ultimo_gesto not in (TipoGesto.CURSOR, TipoGesto.NINGUNO)):
+            return True
+        return self._frame_idx - self._frame_ultima_inferencia >= self._paso_inferencia
+    
+    def _paso_segun_movimiento(self, previas: List[np.ndarray], actuales: List[np.ndarray]) -> int:
+        """Uno de cada 3 frames con las manos quietas; uno de cada 2 si se mueven o no hay manos"""
+        if not actuales or len(actuales) != len(previas):
+            return 2
+        movimiento = max(int(np.abs(a - b).max()) for a, b in zip(actuales, previas))
+        return self._PASO_MANOS_QUIETAS if movimiento < self._MOVIMIENTO_QUIETO_PX else 2
+    
+    def _preparar_entrada(self, frame: np.ndarray) -> np.ndarray:
+        """Reduce el frame y lo convierte a RGB de solo lectura para MediaPipe"""
+        # Los landmarks salen normalizados (0-1) y se mantiene la proporción,
+        # así que reducir el frame no obliga a reescalarlos
+        escala = self.configuracion.lado_max_inferencia / max(frame.shape[:2])
+        
+        # Por encima de 720p el preprocesado (limitado por memoria) compensa hacerlo
+        # en la GPU integrada; MediaPipe necesita un ndarray, así que se baja al final
+        if self._usar_opencl and frame.size > 1280 * 720 * 3:
+            entrada_u = cv2.UMat(frame)
+            if escala < 1.0:
+                entrada_u = cv2.resize(entrada_u, None, fx=escala, fy=escala,
+                                       interpolation=cv2.INTER_AREA)
+            rgb = cv2.cvtColor(entrada_u, cv2.COLOR_BGR2RGB).get()
+            rgb.flags.writeable = False
+            return rgb
+        
+        entrada = frame
+        if escala < 1.0:
+            altura, ancho = frame.shape[:2]
+            tamaño = (max(1, round(ancho * escala)), max(1, round(altura * escala)))
+            entrada = self._vista_buffer('_reducido_buf', (tamaño[1], tamaño[0], 3))
+            cv2.resize(frame, tamaño, dst=entrada, interpolation=cv2.INTER_AREA)
+        
+        # Convertir de BGR a RGB en un buffer persistente (sin reservar memoria por
+        # frame). Se marca de solo lectura para que MediaPipe no copie la imagen
+        atributo = '_rgb_buf'
+        if self.configuracion.pipeline_inferencia:
+            self._usar_buf_alterno = not self._usar_buf_alterno
+            if self._usar_buf_alterno:
+                atributo = '_rgb_buf_alterno'
+        rgb = self._vista_buffer(atributo, entrada.shape)
+        cv2.cvtColor(entrada, cv2.COLOR_BGR2RGB, dst=rgb)
+        rgb.flags.writeable = False
+        return rgb
+    
+    def _vista_buffer(self, atributo: str, forma: Tuple[int, int, int]) -> np.ndarray:
+        """Vista contigua con la forma pedida sobre un buffer plano uint8 que solo crece"""
+        n = forma[0] * forma[1] * forma[2]
+        plano = getattr(self, atributo)
+        if plano is None or plano.size < n:
+            plano = np.empty(n, dtype=np.uint8)
+            setattr(self, atributo, plano)
+        return plano[:n].reshape(forma)
     
     def procesar_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, InfoGesto]:
         """
@@ -1270,11 +1863,36 @@ class DetectorGestos:
         Returns:
             Tuple con frame procesado e información del gesto
         """
-        # Convertir de BGR a RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Detectar manos
-        resultados = self.hands.process(rgb_frame)
+        self._frame_idx += 1
+        ahora_ns = self._ahora_ns = time.monotonic_ns()
+        ahora = self._ahora = ahora_ns * 1e-9
+        
+        if self._debe_inferir(ahora):
+            # Con recorte_roi y manos en el frame anterior, inferir solo en su zona (solo
+            # ahorra preprocesado: MediaPipe redimensiona su entrada a un tamaño fijo)
+            entrada, roi = self._recortar_roi(frame)
+            rgb = self._preparar_entrada(entrada)
+            
+            # Detectar manos
+            if self.configuracion.pipeline_inferencia:
+                resultados = self._inferir_en_segundo_plano(rgb, roi)
+            else:
+                resultados = self._detectar_manos(rgb, roi)
+            self._roi_previo = self._calcular_roi(resultados)
+            self._ultimos_resultados = resultados
+            
+            # Landmarks de cada mano en píxeles, una sola vez por inferencia: los
+            # comparten detección de gestos, calibración y dibujo del esqueleto
+            altura, ancho = frame.shape[:2]
+            manos_px = [_landmarks_a_pixeles(mano, ancho, altura)
+                        for mano in resultados.multi_hand_landmarks or ()]
+            self._paso_inferencia = self._paso_segun_movimiento(self._manos_px, manos_px)
+            self._manos_px = manos_px
+            self._frame_ultima_inferencia = self._frame_idx
+            self._tiempo_ultima_inferencia = ahora
+        else:
+            # Frame intermedio: reutilizar los landmarks de la última inferencia
+            resultados = self._ultimos_resultados
         
         # DETECCIÓN AUTOMÁTICA DE PROYECCIÓN (solo en modo MESA)
         if hasattr(self, '_detectar_proyeccion_automatica') and self._detectar_proyeccion_automatica and self.modo == ModoOperacion.MESA:
@@ -1286,7 +1904,7 @@ class DetectorGestos:
                 
                 self._frame_count_deteccion += 1
                 if self._frame_count_deteccion % 10 == 0:  # Cada 10 frames (más frecuente)
-                    logger.info(f"🔍 Intentando detectar proyección (frame {self._frame_count_deteccion})")
+                    logger.debug("🔍 Intentando detectar proyección (frame %d)", self._frame_count_deteccion)
                     area_detectada = self._detectar_area_proyeccion(frame)
                     if area_detectada:
                         self.area_proyeccion = area_detectada
@@ -1294,7 +1912,7 @@ class DetectorGestos:
                         # Configurar matriz de transformación automática
                         self._configurar_transformacion_automatica()
                     else:
-                        logger.debug(f"⚪ No se detectó proyección en frame {self._frame_count_deteccion}")
+                        logger.debug("⚪ No se detectó proyección en frame %d", self._frame_count_deteccion)
             
             # Dibujar área de proyección si está detectada
             if hasattr(self, 'area_proyeccion') and self.area_proyeccion:
@@ -1303,36 +1921,38 @@ class DetectorGestos:
         # Información del gesto por defecto
         info_gesto = InfoGesto(gesto=TipoGesto.NINGUNO)
         
-        if resultados.multi_hand_landmarks:
-            if len(resultados.multi_hand_landmarks) == 1:
-                # Una mano detectada - resetear zoom
-                self.zoom_activo = False
-                self.distancia_puños_anterior = 0
-                info_gesto = self._detectar_gestos_una_mano(
-                    resultados.multi_hand_landmarks[0], frame
-                )
-            elif len(resultados.multi_hand_landmarks) == 2:
-                # Dos manos detectadas - posible zoom
-                info_gesto = self._detectar_gestos_dos_manos(
-                    resultados.multi_hand_landmarks, frame
-                )
-            
-            # Dibujar landmarks
-            for hand_landmarks in resultados.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
-        else:
-            # No hay manos - resetear zoom
-            self.zoom_activo = False
-            self.distancia_puños_anterior = 0
+        manos_px = self._manos_px
+        if not manos_px:
+            # No hay manos - resetear zoom y votación y saltar gestos, acciones e
+            # indicadores (al volver, un gesto necesita votos nuevos para confirmarse)
+            self._resetear_zoom()
+            self._votos_gesto.clear()
+            self._click_derecho_hecho = False
+            self.ultimo_gesto = info_gesto.gesto
+            self.tiempo_gesto = self._ahora
+            return self.dibujar_interfaz_principal(frame), info_gesto
+        
+        if len(manos_px) == 1:
+            # Una mano detectada - resetear zoom
+            self._resetear_zoom()
+            info_gesto = self._detectar_gestos_una_mano(manos_px[0], frame)
+        elif len(manos_px) == 2:
+            # Dos manos detectadas - posible zoom
+            info_gesto = self._detectar_gestos_dos_manos(manos_px)
+        
+        # Dibujar landmarks (solo con la interfaz visible y si no se desactivaron):
+        # todas las conexiones de cada mano en una única llamada a cv2.polylines
+        if self.mostrar_interfaz and self.configuracion.dibujar_landmarks:
+            for pts in manos_px:
+                cv2.polylines(frame, pts[self._conexiones_mano], False,
+                              (224, 224, 224), 2, cv2.LINE_AA)
         
         # Ejecutar acción según el gesto
         self._ejecutar_accion(info_gesto)
         
         # Actualizar estado
         self.ultimo_gesto = info_gesto.gesto
-        self.tiempo_gesto = time.time()
+        self.tiempo_gesto = self._ahora
         
         # Dibujar interfaz
         frame = self.dibujar_interfaz_principal(frame)
@@ -1342,214 +1962,197 @@ class DetectorGestos:
         
         return frame, info_gesto
     
-    def _detectar_gestos_una_mano(self, landmarks, frame: np.ndarray) -> InfoGesto:
-        """Detecta gestos con una sola mano"""
-        altura, ancho = frame.shape[:2]
-        
+    def _detectar_gestos_una_mano(self, pts_px: np.ndarray, frame: np.ndarray) -> InfoGesto:
+        """Detecta gestos con una sola mano (pts_px: landmarks (21, 2) int32 en píxeles)"""
         # 🔧 CALIBRACIÓN AUTOMÁTICA DE DISTANCIA
-        self._calibrar_distancia_automatica(landmarks, (altura, ancho))
+        self._calibrar_distancia_automatica(pts_px)
         
         # Si estamos calibrando, procesar calibración
         if self.calibrando and not self.esperando_confirmacion:
-            self._procesar_calibracion(frame, landmarks)
+            self._procesar_calibracion(frame, pts_px)
         elif self.esperando_confirmacion:
-            self._procesar_confirmacion_calibracion(frame, landmarks)
-            return InfoGesto(gesto=TipoGesto.NINGUNO)
+            self._procesar_confirmacion_calibracion(frame, pts_px)
+            return _info_gesto(GESTO_NINGUNO)
         
-        # Convertir landmarks a coordenadas de píxeles
-        puntos = []
-        for landmark in landmarks.landmark:
-            x = int(landmark.x * ancho)
-            y = int(landmark.y * altura)
-            puntos.append((x, y))
+        # Punto de control (como tupla de int para el resto del pipeline)
+        indice_tip = tuple(pts_px[8].tolist())
         
-        # Obtener puntos clave
-        pulgar_tip = puntos[4]
-        indice_tip = puntos[8]
-        medio_tip = puntos[12]
+        # Atributos consultados varias veces por frame, leídos una sola vez
+        filtrar_area = (self.modo == ModoOperacion.MESA and
+                        bool(getattr(self, 'area_proyeccion', None)))
+        dentro_proyeccion = self._punto_dentro_proyeccion
         
         # 🚫 FILTRO PRINCIPAL: En modo MESA con área detectada, ignorar manos fuera del área
-        if (self.modo == ModoOperacion.MESA and 
-            hasattr(self, 'area_proyeccion') and self.area_proyeccion):
+        if filtrar_area:
             # Verificar si el índice (punto principal de control) está dentro del área
-            if not self._punto_dentro_proyeccion(indice_tip[0], indice_tip[1]):
+            if not dentro_proyeccion(indice_tip[0], indice_tip[1]):
                 # Mano fuera del área de proyección - ignorar completamente
-                return InfoGesto(gesto=TipoGesto.NINGUNO)
-        
-        # Calcular distancias para gestos de pinza
-        distancia_pulgar_indice = np.sqrt((pulgar_tip[0] - indice_tip[0])**2 + 
-                                         (pulgar_tip[1] - indice_tip[1])**2)
-        distancia_pulgar_medio = np.sqrt((pulgar_tip[0] - medio_tip[0])**2 + 
-                                        (pulgar_tip[1] - medio_tip[1])**2)
-        
-        # Determinar gesto
-        tiempo_actual = time.time()
-        
-        # Click izquierdo con pinza pulgar+índice (permite arrastre)
-        if distancia_pulgar_indice < self.distancia_pinza_adaptativa:
-            # Solo permitir click si la mano está cerca o la pinza está muy cerrada
-            if getattr(self, 'factor_distancia', 1.0) > 0.7 or distancia_pulgar_indice < 20:
-                posicion_click = ((pulgar_tip[0] + indice_tip[0]) // 2, (pulgar_tip[1] + indice_tip[1]) // 2)
-                
-                # 🚫 FILTRAR CLICKS FUERA DEL ÁREA DE PROYECCIÓN
-                if (self.modo == ModoOperacion.MESA and 
-                    hasattr(self, 'area_proyeccion') and self.area_proyeccion and
-                    not self._punto_dentro_proyeccion(posicion_click[0], posicion_click[1])):
-                    # Si está fuera del área, retornar cursor normal
-                    return InfoGesto(
-                        gesto=TipoGesto.CURSOR,
-                        posicion=indice_tip,
-                        confianza=0.7
-                    )
-                
-                # Click izquierdo con soporte de arrastre
-                return InfoGesto(
-                    gesto=TipoGesto.CLICK_IZQUIERDO,
-                    posicion=posicion_click,
-                    confianza=0.9
-                )
-            # Si no cumple la condición de distancia, solo cursor
-            else:
-                return InfoGesto(
-                    gesto=TipoGesto.CURSOR,
-                    posicion=indice_tip,
-                    confianza=0.7
-                )
-        
-        elif distancia_pulgar_medio < self.distancia_pinza_adaptativa:
-            # Click derecho
-            posicion_click = ((pulgar_tip[0] + medio_tip[0]) // 2, (pulgar_tip[1] + medio_tip[1]) // 2)
-            
-            # 🚫 FILTRAR CLICKS DERECHOS FUERA DEL ÁREA DE PROYECCIÓN
-            if (self.modo == ModoOperacion.MESA and 
-                hasattr(self, 'area_proyeccion') and self.area_proyeccion and
-                not self._punto_dentro_proyeccion(posicion_click[0], posicion_click[1])):
-                # Si está fuera del área, retornar cursor normal
-                return InfoGesto(
-                    gesto=TipoGesto.CURSOR,
-                    posicion=indice_tip,
-                    confianza=0.7
-                )
-            
-            return InfoGesto(
-                gesto=TipoGesto.CLICK_DERECHO,
-                posicion=posicion_click,
-                confianza=0.9
-            )
-        
-        else:
-            # Cursor (mano abierta) - usar el índice como punto de control
-            posicion_suavizada = self._suavizar_movimiento(indice_tip[0], indice_tip[1])
-            return InfoGesto(
-                gesto=TipoGesto.CURSOR,
-                posicion=posicion_suavizada,
-                confianza=0.8
-            )
-    
-    def _detectar_gestos_dos_manos(self, landmarks_list, frame: np.ndarray) -> InfoGesto:
-        """Detecta gestos con dos manos (zoom)"""
-        altura, ancho = frame.shape[:2]
-        
-        # Obtener posiciones de las muñecas de ambas manos
-        mano1 = landmarks_list[0].landmark[0]  # Muñeca mano 1
-        mano2 = landmarks_list[1].landmark[0]  # Muñeca mano 2
-        
-        pos1 = (int(mano1.x * ancho), int(mano1.y * altura))
-        pos2 = (int(mano2.x * ancho), int(mano2.y * altura))
-        
-        # Calcular distancia entre manos
-        distancia_actual = np.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+                return _info_gesto(GESTO_NINGUNO)
+        
+        # Decidir el gesto (kernel numba si está disponible); umbrales al cuadrado
+        gesto, x, y, confianza, pinza_indice = clasificar_gesto_mano(
+            pts_px, self._pinza_umbral_sq, float(getattr(self, 'factor_distancia', 1.0)),
+            self._pinza_tras_doble, self.boton_presionado,
+            self._ahora_ns - self.ultimo_click_tiempo, self._doble_click_ns,
+            self.ultimo_click_pos[0], self.ultimo_click_pos[1])
+        posicion = (int(x), int(y))
+        
+        # Al abrir la pinza se puede volver a hacer click normal
+        if not pinza_indice:
+            self._pinza_tras_doble = False
+        
+        if gesto == GESTO_CURSOR:
+            # Mano abierta: suavizar; la pinza débil mueve el cursor sin suavizado
+            if not pinza_indice:
+                posicion = self._suavizar_movimiento(posicion[0], posicion[1])
+            return _info_gesto(GESTO_CURSOR, posicion, confianza)
+        
+        if gesto == GESTO_NINGUNO:
+            return _info_gesto(GESTO_NINGUNO)
+        
+        # 🚫 FILTRAR CLICKS FUERA DEL ÁREA DE PROYECCIÓN: cursor normal en el índice
+        if filtrar_area and not dentro_proyeccion(posicion[0], posicion[1]):
+            return _info_gesto(GESTO_CURSOR, indice_tip, 0.7)
+        
+        if gesto == GESTO_DOBLE_CLICK:
+            self._pinza_tras_doble = True
+        elif gesto == GESTO_CLICK_IZQUIERDO and not self.boton_presionado:
+            self.ultimo_click_pos = posicion
+        return _info_gesto(gesto, posicion, confianza)
+    
+    def _detectar_gestos_dos_manos(self, manos_px: List[np.ndarray]) -> InfoGesto:
+        """Detecta gestos con dos manos (zoom) a partir de sus landmarks en píxeles"""
+        # Posiciones de las muñecas (landmark 0) de ambas manos
+        x1, y1 = manos_px[0][0].tolist()
+        x2, y2 = manos_px[1][0].tolist()
+        
+        # Distancia al cuadrado entre manos y punto medio (posición del zoom)
+        dx = x1 - x2
+        dy = y1 - y2
+        distancia2 = dx * dx + dy * dy
+        punto_medio = ((x1 + x2) >> 1, (y1 + y2) >> 1)
         
         # Si es la primera vez o el zoom no estaba activo, inicializar
-        if not self.zoom_activo or self.distancia_puños_anterior == 0:
+        distancia_anterior = self.distancia_puños_anterior
+        if not self.zoom_activo or distancia_anterior == 0:
             self.zoom_activo = True
-            self.distancia_puños_anterior = distancia_actual
-            return InfoGesto(gesto=TipoGesto.NINGUNO)
-        
-        # Calcular diferencia con umbral más pequeño para mejor sensibilidad
-        diferencia = distancia_actual - self.distancia_puños_anterior
-        umbral_minimo = 15  # píxeles de cambio mínimo para detectar zoom
+            self.distancia_puños_anterior = sqrt(distancia2)
+            return _info_gesto(GESTO_NINGUNO)
         
-        resultado = InfoGesto(gesto=TipoGesto.NINGUNO)
+        # Se compara contra (anterior ± umbral)² y la raíz solo se calcula cuando el
+        # cambio es significativo; el sentido contrario al último zoom pide más
+        umbral = max(self._UMBRAL_ZOOM_PX, self._UMBRAL_ZOOM_RELATIVO * distancia_anterior)
+        umbral_in = umbral * self._HISTERESIS_ZOOM if self._sentido_zoom < 0 else umbral
+        umbral_out = umbral * self._HISTERESIS_ZOOM if self._sentido_zoom > 0 else umbral
         
-        if diferencia > umbral_minimo:
+        if distancia2 > (distancia_anterior + umbral_in) ** 2:
             # Manos se alejan = Zoom in
-            resultado = InfoGesto(
-                gesto=TipoGesto.ZOOM_IN,
-                posicion=((pos1[0] + pos2[0]) // 2, (pos1[1] + pos2[1]) // 2),
-                confianza=0.8
-            )
-            logger.debug(f"Zoom IN detectado: distancia {self.distancia_puños_anterior:.1f} → {distancia_actual:.1f} (diff: +{diferencia:.1f})")
-        elif diferencia < -umbral_minimo:
+            codigo = GESTO_ZOOM_IN
+            self._sentido_zoom = 1
+        elif distancia_anterior > umbral_out and distancia2 < (distancia_anterior - umbral_out) ** 2:
             # Manos se acercan = Zoom out
-            resultado = InfoGesto(
-                gesto=TipoGesto.ZOOM_OUT,
-                posicion=((pos1[0] + pos2[0]) // 2, (pos1[1] + pos2[1]) // 2),
-                confianza=0.8
-            )
-            logger.debug(f"Zoom OUT detectado: distancia {self.distancia_puños_anterior:.1f} → {distancia_actual:.1f} (diff: {diferencia:.1f})")
+            codigo = GESTO_ZOOM_OUT
+            self._sentido_zoom = -1
+        else:
+            return _info_gesto(GESTO_NINGUNO)
+        
+        distancia_actual = sqrt(distancia2)
+        resultado = _info_gesto(codigo, punto_medio, 0.8,
+                                {'razon': distancia_actual / distancia_anterior})
+        logger.debug("Zoom %s detectado: distancia %.1f → %.1f (diff: %+.1f)",
+                     'IN' if codigo == GESTO_ZOOM_IN else 'OUT', distancia_anterior,
+                     distancia_actual, distancia_actual - distancia_anterior)
         
         # Actualizar distancia anterior solo si hubo un cambio significativo
-        if abs(diferencia) > umbral_minimo:
-            self.distancia_puños_anterior = distancia_actual
+        self.distancia_puños_anterior = distancia_actual
         
         return resultado
     
+    def _resetear_zoom(self):
+        """Olvida la distancia de referencia y el sentido del zoom (menos de dos manos)"""
+        self.zoom_activo = False
+        self.distancia_puños_anterior = 0
+        self._sentido_zoom = 0
+    
     def _suavizar_movimiento(self, x: int, y: int) -> Tuple[int, int]:
-        """Aplica suavizado al movimiento del cursor"""
-        self.historial_x.append(x)
-        self.historial_y.append(y)
-        
-        if len(self.historial_x) > self.suavizado:
-            self.historial_x.pop(0)
-        if len(self.historial_y) > self.suavizado:
-            self.historial_y.pop(0)
-        
-        x_suavizado = int(np.mean(self.historial_x))
-        y_suavizado = int(np.mean(self.historial_y))
-        
-        return (x_suavizado, y_suavizado)
+        """Aplica suavizado al movimiento del cursor (media móvil exponencial)"""
+        if self._ema_x is None:
+            self._ema_x, self._ema_y = float(x), float(y)
+        else:
+            a = self._alfa_suavizado
+            self._ema_x += a * (x - self._ema_x)
+            self._ema_y += a * (y - self._ema_y)
+        return (int(self._ema_x), int(self._ema_y))
     
     def _ejecutar_accion(self, info_gesto: InfoGesto):
         """Ejecuta la acción correspondiente al gesto detectado"""
-        if info_gesto.gesto == TipoGesto.CURSOR and info_gesto.posicion:
-            # Si el botón estaba presionado y ahora es cursor (mano abierta), soltar
-            if self.boton_presionado:
-                try:
-                    pyautogui.mouseUp()
-                    self.boton_presionado = False
-                    self.arrastrando = False
-                    logger.info("Click soltado (arrastre terminado)")
-                except pyautogui.FailSafeException:
-                    logger.warning("FailSafe activado - mouseUp cancelado")
+        codigo = info_gesto.codigo
+        self._votos_gesto.append(codigo)
+        confirmado = self._votos_gesto.count(codigo) >= self._VOTOS_MINIMOS
+        if codigo != GESTO_CLICK_DERECHO:
+            self._click_derecho_hecho = False
+        
+        accion = self._acciones.get(codigo)
+        if accion is not None:
+            accion(info_gesto, confirmado)
+    
+    def _accion_cursor(self, info_gesto: InfoGesto, confirmado: bool):
+        """Mano abierta: suelta el botón si estaba presionado y mueve el cursor"""
+        if not info_gesto.posicion:
+            return
+        # Si el botón estaba presionado y ahora es cursor (mano abierta), soltar
+        if self.boton_presionado:
+            try:
+                pyautogui.mouseUp()
+                self.boton_presionado = False
+                self.arrastrando = False
+                logger.debug("Click soltado (arrastre terminado)")
+            except pyautogui.FailSafeException:
+                logger.warning("FailSafe activado - mouseUp cancelado")
+        self._mover_cursor(info_gesto.posicion)
+    
+    def _accion_click_izquierdo(self, info_gesto: InfoGesto, confirmado: bool):
+        """Pinza pulgar+índice: presiona el botón (inicia arrastre) o continúa el arrastre"""
+        # Presionar el botón si no está presionado, una vez confirmada la pinza por votación
+        if not self.boton_presionado:
+            if not confirmado or not self._boton_libre():
+                return
+            try:
+                pyautogui.mouseDown()
+                self._tiempo_ultimo_boton = self._ahora_ns
+                self.boton_presionado = True
+                self.arrastrando = True
+                self.ultimo_click_tiempo = self._ahora_ns
+                logger.debug("Click izquierdo presionado (arrastre iniciado)")
+            except pyautogui.FailSafeException:
+                logger.warning("FailSafe activado - mouseDown cancelado")
+        # Si ya está presionado, solo mover (continuar arrastre)
+        elif info_gesto.posicion:
             self._mover_cursor(info_gesto.posicion)
-        
-        elif info_gesto.gesto == TipoGesto.CLICK_IZQUIERDO:
-            # Presionar el botón si no está presionado (inicia arrastre)
-            if not self.boton_presionado:
-                try:
-                    pyautogui.mouseDown()
-                    self.boton_presionado = True
-                    self.arrastrando = True
-                    self.ultimo_click_tiempo = time.time()
-                    logger.info("Click izquierdo presionado (arrastre iniciado)")
-                except pyautogui.FailSafeException:
-                    logger.warning("FailSafe activado - mouseDown cancelado")
-            # Si ya está presionado, solo mover (continuar arrastre)
-            elif info_gesto.posicion:
-                self._mover_cursor(info_gesto.posicion)
-        
-        elif info_gesto.gesto == TipoGesto.DOBLE_CLICK:
-            self._realizar_doble_click()
-        
-        elif info_gesto.gesto == TipoGesto.CLICK_DERECHO:
+    
+    def _accion_doble_click(self, info_gesto: InfoGesto, confirmado: bool):
+        """Ya llega filtrado (ventana de tiempo y distancia) y dura un solo frame: sin votación"""
+        self._realizar_doble_click()
+    
+    def _accion_click_derecho(self, info_gesto: InfoGesto, confirmado: bool):
+        """Un solo click derecho por pinza mantenida"""
+        if confirmado and not self._click_derecho_hecho and self._boton_libre():
             self._realizar_click_derecho()
-        
-        elif info_gesto.gesto == TipoGesto.ZOOM_IN:
-            self._realizar_zoom(self.configuracion.factor_zoom_in)
-        
-        elif info_gesto.gesto == TipoGesto.ZOOM_OUT:
-            self._realizar_zoom(self.configuracion.factor_zoom_out)
+            self._click_derecho_hecho = True
+    
+    def _accion_zoom_in(self, info_gesto: InfoGesto, confirmado: bool):
+        """Cada cambio de distancia llega en un solo frame (la referencia se reinicia): sin votación"""
+        self._realizar_zoom(self.configuracion.factor_zoom_in, info_gesto.metadatos)
+    
+    def _accion_zoom_out(self, info_gesto: InfoGesto, confirmado: bool):
+        """Cada cambio de distancia llega en un solo frame (la referencia se reinicia): sin votación"""
+        self._realizar_zoom(self.configuracion.factor_zoom_out, info_gesto.metadatos)
+    
+    def actualizar_tamaño_frame(self, ancho: int, altura: int):
+        """Recalcula la escala frame -> pantalla cuando cambian las dimensiones del frame"""
+        self._tamaño_frame = (ancho, altura)
+        self._escala_x = self.ancho_pantalla / ancho
+        self._escala_y = self.alto_pantalla / altura
     
     def _mover_cursor(self, posicion: Tuple[int, int]):
         """Mueve el cursor a la posición especificada"""
@@ -1565,74 +2168,103 @@ class DetectorGestos:
             # Mapear coordenadas del área de proyección a pantalla
             posicion = self._mapear_coordenadas_proyeccion(posicion[0], posicion[1])
             
-        elif self.modo == ModoOperacion.MESA and len(self.puntos_camara) >= 4:
+        elif self.modo == ModoOperacion.MESA and self.n_puntos_calibrados >= 4:
             # Usar calibración manual existente
             posicion = self._transformar_coordenadas(posicion)
         else:
-            # Mapear directamente a la pantalla (modo pantalla)
-            # Obtener dimensiones reales del frame
-            ancho_frame = 640  # Se puede obtener dinámicamente
-            alto_frame = 480
-            
-            x_pantalla = int(posicion[0] * self.ancho_pantalla / ancho_frame)
-            y_pantalla = int(posicion[1] * self.alto_pantalla / alto_frame)
-            posicion = (x_pantalla, y_pantalla)
+            # Mapear directamente a la pantalla (modo pantalla) con la escala precalculada
+            posicion = (int(posicion[0] * self._escala_x), int(posicion[1] * self._escala_y))
+        
+        # Ignorar desplazamientos de un píxel: ahorran una llamada al sistema por frame
+        if abs(posicion[0] - self.cursor_x) + abs(posicion[1] - self.cursor_y) < self._UMBRAL_CURSOR_PX:
+            return
         
         try:
-            pyautogui.moveTo(posicion[0], posicion[1], duration=0.01)
+            # Sin botón pulsado se usa la llamada nativa; durante un arrastre se deja a
+            # pyautogui, que en macOS genera los eventos de arrastre que Quartz no emite
+            if MOVER_CURSOR_NATIVO is not None and not self.boton_presionado:
+                self._movimientos_nativos += 1
+                if self._movimientos_nativos % self._VERIFICAR_FAILSAFE_CADA == 0:
+                    pyautogui.failSafeCheck()
+                MOVER_CURSOR_NATIVO(posicion[0], posicion[1])
+            else:
+                pyautogui.moveTo(posicion[0], posicion[1], _pause=False)
             self.cursor_x, self.cursor_y = posicion
         except pyautogui.FailSafeException:
-            logger.warning("FailSafe activado - movimiento cancelado")
+            # Con la mano en la esquina salta en cada frame: avisar como mucho una vez por segundo
+            if self._ahora_ns - self._ultimo_aviso_failsafe >= 1_000_000_000:
+                self._ultimo_aviso_failsafe = self._ahora_ns
+                logger.warning("FailSafe activado - movimiento cancelado")
+    
+    def _boton_libre(self) -> bool:
+        """True si ya pasó la separación mínima desde el último evento de botón"""
+        return self._ahora_ns - self._tiempo_ultimo_boton >= self._ESPACIO_MIN_BOTON_NS
     
     def _realizar_click_izquierdo(self):
         """Realiza un click izquierdo"""
+        if not self._boton_libre():
+            return
         try:
             pyautogui.click()
-            self.ultimo_click_tiempo = time.time()
+            self._tiempo_ultimo_boton = self.ultimo_click_tiempo = self._ahora_ns
             self.arrastrando = True
-            logger.info("Click izquierdo ejecutado")
+            logger.debug("Click izquierdo ejecutado")
         except pyautogui.FailSafeException:
             logger.warning("FailSafe activado - click cancelado")
     
     def _realizar_doble_click(self):
-        """Realiza un doble click"""
+        """Completa un doble click (la pinza anterior ya hizo el primer click)"""
         try:
-            pyautogui.doubleClick()
-            logger.info("Doble click ejecutado")
+            pyautogui.click()
+            self._tiempo_ultimo_boton = self._ahora_ns
+            self.ultimo_click_tiempo = 0  # Un tercer toque empieza de nuevo
+            logger.debug("Doble click ejecutado")
         except pyautogui.FailSafeException:
             logger.warning("FailSafe activado - doble click cancelado")
     
     def _realizar_click_derecho(self):
         """Realiza un click derecho"""
+        if not self._boton_libre():
+            return
         try:
             pyautogui.rightClick()
-            logger.info("Click derecho ejecutado")
+            self._tiempo_ultimo_boton = self._ahora_ns
+            logger.debug("Click derecho ejecutado")
         except pyautogui.FailSafeException:
             logger.warning("FailSafe activado - click derecho cancelado")
     
-    def _realizar_zoom(self, factor: float):
-        """Realiza zoom in/out"""
-        if time.time() - self.cooldown_zoom > 0.1:  # Cooldown de 100ms
+    def _realizar_zoom(self, factor: float, metadatos: Optional[Dict[str, Any]] = None):
+        """Realiza zoom in/out con un único scroll proporcional al cambio de distancia entre manos"""
+        if self._ahora_ns - self.cooldown_zoom > self._COOLDOWN_ZOOM_NS:
+            # Pasos de scroll según la razón entre distancias (3 por cada duplicación)
+            razon = metadatos.get('razon') if metadatos else None
+            pasos = max(1, round(abs(log2(razon)) * 3)) if razon else 3
             try:
                 if factor > 1.0:
-                    pyautogui.scroll(3)  # Zoom in
-                    logger.info("Zoom in ejecutado")
+                    pyautogui.scroll(pasos)  # Zoom in
+                    logger.debug("Zoom in ejecutado (%d)", pasos)
                 else:
-                    pyautogui.scroll(-3)  # Zoom out
-                    logger.info("Zoom out ejecutado")
-                self.cooldown_zoom = time.time()
+                    pyautogui.scroll(-pasos)  # Zoom out
+                    logger.debug("Zoom out ejecutado (%d)", pasos)
+                self.cooldown_zoom = self._ahora_ns
             except pyautogui.FailSafeException:
                 logger.warning("FailSafe activado - zoom cancelado")
     
     def _transformar_coordenadas(self, punto: Tuple[int, int]) -> Tuple[int, int]:
         """Transforma coordenadas de la cámara al espacio de proyección"""
-        punto_h = np.array([punto[0], punto[1], 1.0])
-        punto_transformado = np.dot(self.matriz_transformacion, punto_h)
-        
-        if punto_transformado[2] != 0:
-            punto_transformado = punto_transformado / punto_transformado[2]
-        
-        return (int(punto_transformado[0]), int(punto_transformado[1]))
+        if KERNELS_COMPILADOS:
+            return transformar_punto(self.matriz_transformacion, float(punto[0]), float(punto[1]))
+        
+        # Sin el kernel compilado: aritmética escalar con los coeficientes cacheados
+        h0, h1, h2, h3, h4, h5, h6, h7, h8 = self._h
+        x, y = punto
+        u = h0 * x + h1 * y + h2
+        v = h3 * x + h4 * y + h5
+        w = h6 * x + h7 * y + h8
+        if w != 0.0:
+            u /= w
+            v /= w
+        return (int(u), int(v))
     
     def _dibujar_indicadores_gestos(self, frame: np.ndarray, info_gesto: InfoGesto):
         """Dibuja indicadores visuales de los gestos detectados"""
@@ -1641,47 +2273,27 @@ class DetectorGestos:
         
         x, y = info_gesto.posicion
         
-        # Color y texto según el tipo de gesto
-        if info_gesto.gesto == TipoGesto.CURSOR:
-            if info_gesto.confianza > 0.9:  # Índice extendido
-                color = (0, 255, 255)  # Amarillo
-                texto = "PRECISION"
-                radio = 15
-            else:  # Mano abierta
-                color = self.configuracion.color_primario
-                texto = "CURSOR"
-                radio = 20
-        elif info_gesto.gesto == TipoGesto.CLICK_IZQUIERDO:
-            color = (255, 0, 0)  # Rojo para click izquierdo
-            texto = "CLICK"
-            radio = 25
-        elif info_gesto.gesto == TipoGesto.DOBLE_CLICK:
-            color = (255, 100, 0)
-            texto = "DOBLE CLICK"
-            radio = 30
-        elif info_gesto.gesto == TipoGesto.CLICK_DERECHO:
-            color = (0, 0, 255)
-            texto = "CLICK DER"
-            radio = 25
-        elif info_gesto.gesto in [TipoGesto.ZOOM_IN, TipoGesto.ZOOM_OUT]:
-            color = (255, 255, 0)
-            texto = "ZOOM"
-            radio = 35
+        # Color, texto y radio según el tipo de gesto (tabla precalculada)
+        if info_gesto.codigo == GESTO_CURSOR and info_gesto.confianza > 0.9:
+            render = self._render_precision  # Índice extendido
         else:
-            return
+            render = self._render_gesto.get(info_gesto.codigo)
+            if render is None:
+                return
+        color, texto, radio = render
         
-        # Dibujar círculo en la posición
-        cv2.circle(frame, (x, y), radio, color, 3)
-        cv2.circle(frame, (x, y), 5, color, -1)
+        # Dibujar círculo en la posición (LINE_4: sin coste de suavizado)
+        cv2.circle(frame, (x, y), radio, color, 3, cv2.LINE_4)
+        cv2.circle(frame, (x, y), 5, color, -1, cv2.LINE_4)
         
         # Dibujar texto del gesto
-        cv2.putText(frame, texto, (x - 40, y - radio - 10), cv2.FONT_HERSHEY_SIMPLEX, 
+        cv2.putText(frame, texto, (x - 40, y - radio - 10), _FONT, 
                    0.7, color, 2)
         
         # Añadir indicador de confianza
         if info_gesto.confianza > 0:
             confianza_texto = f"{int(info_gesto.confianza * 100)}%"
-            cv2.putText(frame, confianza_texto, (x - 20, y + radio + 25), cv2.FONT_HERSHEY_SIMPLEX, 
+            cv2.putText(frame, confianza_texto, (x - 20, y + radio + 25), _FONT, 
                        0.5, color, 1)
     
     def manejar_teclas(self, tecla: int) -> bool:
@@ -1694,47 +2306,61 @@ class DetectorGestos:
         Returns:
             True si debe continuar, False si debe salir
         """
-        if tecla == 27:  # ESC
-            return False
-        elif tecla == ord('v') or tecla == ord('V'):  # Ver/ocultar interfaz
-            self.alternar_interfaz()
-        elif tecla == ord('m') or tecla == ord('M'):
-            self._cambiar_modo()
-        elif tecla == ord('q') or tecla == ord('Q'):
-            return False
-        elif tecla == ord('k') or tecla == ord('K'):  # Cambiar cámara
-            self._cambiar_camara()
-        elif tecla == ord('c') or tecla == ord('C'):  # Calibración
-            self._iniciar_calibracion()
-        elif tecla == ord('a') or tecla == ord('A'):  # Detección automática
-            if self.modo == ModoOperacion.MESA:
-                self._activar_deteccion_automatica()
-            else:
-                logger.info("⚠️  Detección automática solo disponible en modo MESA")
-        elif tecla == ord('u') or tecla == ord('U'):  # Deshacer último punto
-            self.deshacer_ultimo_punto()
-        elif tecla == ord('r') or tecla == ord('R'):
-            # Reset zoom y calibración
-            self.zoom_base = 1.0
-            if self.modo == ModoOperacion.MESA:
-                self.puntos_camara = []
-                self.puntos_proyeccion = []
-                self.matriz_transformacion = np.eye(3)
-                logger.info("Calibración reseteada")
-            logger.info("Sistema reseteado")
-        elif tecla == ord('+') or tecla == ord('='):  # Aumentar margen
-            if self.modo == ModoOperacion.MESA:
-                self.MARGEN_AREA = min(200, self.MARGEN_AREA + 10)
-                logger.info(f"📏 Margen aumentado a {self.MARGEN_AREA}px")
-        elif tecla == ord('-') or tecla == ord('_'):  # Disminuir margen
-            if self.modo == ModoOperacion.MESA:
-                self.MARGEN_AREA = max(0, self.MARGEN_AREA - 10)
-                logger.info(f"📏 Margen reducido a {self.MARGEN_AREA}px")
-        
-        return True
+        accion = self._teclas.get(tecla)
+        return accion() is not False if accion is not None else True
+    
+    def _crear_tabla_teclas(self) -> Dict[int, Any]:
+        """Tabla código de tecla -> acción; una acción que devuelve False termina el programa"""
+        salir = lambda: False
+        tabla = {27: salir}  # ESC
+        for letra, accion in (
+            ('q', salir),
+            ('v', self.alternar_interfaz),  # Ver/ocultar interfaz
+            ('m', self._cambiar_modo),
+            ('k', self._cambiar_camara),  # Cambiar cámara
+            ('c', self._iniciar_calibracion),  # Calibración
+            ('a', self._tecla_deteccion_automatica),  # Detección automática
+            ('u', self.deshacer_ultimo_punto),  # Deshacer último punto
+            ('r', self._resetear_sistema),  # Reset zoom y calibración
+        ):
+            tabla[ord(letra)] = tabla[ord(letra.upper())] = accion
+        aumentar = lambda: self._ajustar_margen(10)
+        disminuir = lambda: self._ajustar_margen(-10)
+        tabla[ord('+')] = tabla[ord('=')] = aumentar
+        tabla[ord('-')] = tabla[ord('_')] = disminuir
+        return tabla
+    
+    def _tecla_deteccion_automatica(self):
+        """Activa la detección automática del área de proyección (solo modo MESA)"""
+        if self.modo == ModoOperacion.MESA:
+            self._activar_deteccion_automatica()
+        else:
+            logger.info("⚠️  Detección automática solo disponible en modo MESA")
+    
+    def _resetear_sistema(self):
+        """Resetea el zoom y, en modo MESA, la calibración"""
+        self.zoom_base = 1.0
+        if self.modo == ModoOperacion.MESA:
+            self.n_puntos_calibrados = 0
+            self._asignar_matriz_transformacion(np.eye(3))
+            logger.info("Calibración reseteada")
+        logger.info("Sistema reseteado")
+    
+    def _ajustar_margen(self, delta: int):
+        """Ajusta el margen del área de proyección (solo modo MESA), entre 0 y 200 px"""
+        if self.modo != ModoOperacion.MESA:
+            return
+        self.MARGEN_AREA = min(200, max(0, self.MARGEN_AREA + delta))
+        if delta > 0:
+            logger.info(f"📏 Margen aumentado a {self.MARGEN_AREA}px")
+        else:
+            logger.info(f"📏 Margen reducido a {self.MARGEN_AREA}px")
     
     def finalizar(self):
         """Limpia recursos y finaliza el detector"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         self.hands.close()
         logger.info("Detector de gestos finalizado")
     
@@ -1750,13 +2376,11 @@ class DetectorGestos:
         logger.info("- Recalibrar (empezar de nuevo)")
         logger.info("- Cancelar (salir de calibración)")
     
-    def _procesar_confirmacion_calibracion(self, frame: np.ndarray, landmarks):
-        """Procesa la confirmación de calibración"""
+    def _procesar_confirmacion_calibracion(self, frame: np.ndarray, puntos: np.ndarray):
+        """Procesa la confirmación de calibración (puntos: landmarks (21, 2) en píxeles)"""
         if not self.esperando_confirmacion:
             return
         
-        altura, ancho = frame.shape[:2]
-        
         # Dibujar preview del área calibrada
         if self.mostrar_preview_pantalla:
             self._dibujar_preview_pantalla_calibrada(frame)
@@ -1764,18 +2388,9 @@ class DetectorGestos:
         # Dibujar interfaz de confirmación
         self._dibujar_interfaz_confirmacion(frame)
         
-        # Detectar gestos para navegación
-        puntos = []
-        for landmark in landmarks.landmark:
-            x = int(landmark.x * ancho)
-            y = int(landmark.y * altura)
-            puntos.append((x, y))
-        
         # Detectar gesto de índice extendido para selección
         if self._es_gesto_indice_extendido(puntos):
-            indice_tip = landmarks.landmark[8]
-            x_dedo = int(indice_tip.x * ancho)
-            y_dedo = int(indice_tip.y * altura)
+            x_dedo, y_dedo = puntos[8].tolist()
             
             # Verificar en qué botón está el dedo
             nueva_opcion = self._detectar_boton_confirmacion(x_dedo, y_dedo, frame)
@@ -1785,9 +2400,9 @@ class DetectorGestos:
         # Detectar gesto de selección (puño cerrado) para confirmar opción
         if self._es_gesto_seleccion(puntos):
             if not hasattr(self, 'tiempo_seleccion_confirmacion'):
-                self.tiempo_seleccion_confirmacion = time.time()
+                self.tiempo_seleccion_confirmacion = self._ahora
             
-            tiempo_transcurrido = time.time() - self.tiempo_seleccion_confirmacion
+            tiempo_transcurrido = self._ahora - self.tiempo_seleccion_confirmacion
             if tiempo_transcurrido >= 1.5:  # 1.5 segundos para confirmar
                 self._ejecutar_opcion_confirmacion()
                 delattr(self, 'tiempo_seleccion_confirmacion')
@@ -1797,10 +2412,9 @@ class DetectorGestos:
     
     def _dibujar_preview_pantalla_calibrada(self, frame: np.ndarray):
         """Dibuja el preview del área calibrada como un rectángulo"""
-        if len(self.puntos_camara) >= 4:
+        if self.n_puntos_calibrados >= 4:
             # Dibujar rectángulo del área calibrada
-            pts = np.array(self.puntos_camara, np.int32)
-            pts = pts.reshape((-1, 1, 2))
+            pts = self.puntos_camara.astype(np.int32).reshape((-1, 1, 2))
             
             # Dibujar área rellena semi-transparente
             overlay = frame.copy()
@@ -1811,81 +2425,67 @@ class DetectorGestos:
             cv2.polylines(frame, [pts], True, (0, 255, 0), 3)
             
             # Dibujar puntos numerados
-            for i, punto in enumerate(self.puntos_camara):
+            for i, punto in enumerate(map(tuple, pts.reshape(-1, 2).tolist())):
                 cv2.circle(frame, punto, 12, (0, 255, 0), -1)
                 cv2.circle(frame, punto, 15, (255, 255, 255), 2)
                 cv2.putText(frame, f"{i+1}", (punto[0]-5, punto[1]+5), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 2)
+                           _FONT, 0.6, (0, 0, 0), 2)
     
     def _dibujar_interfaz_confirmacion(self, frame: np.ndarray):
         """Dibuja la interfaz de confirmación de calibración"""
         altura, ancho = frame.shape[:2]
         
         # Fondo para la interfaz
-        cv2.rectangle(frame, (10, altura-150), (ancho-10, altura-10), (50, 50, 50), -1)
-        cv2.rectangle(frame, (10, altura-150), (ancho-10, altura-10), (255, 255, 255), 2)
+        _rectangulo_panel(frame, (10, altura-150), (ancho-10, altura-10), (50, 50, 50), (255, 255, 255))
         
         # Título
         cv2.putText(frame, "¿El area verde representa tu pantalla correctamente?", 
-                   (20, altura-120), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                   (20, altura-120), _FONT, 0.7, (255, 255, 255), 2)
         
         # Opciones con indicador de selección
         opciones = ["CONFIRMAR", "RECALIBRAR", "CANCELAR"]
         colores = [(0, 255, 0), (255, 255, 0), (0, 0, 255)]
         
-        y_botones = altura - 80
-        espacio_boton = (ancho - 40) // 3
+        self._actualizar_layout(frame)
+        botones = self._layout['botones_confirmacion']
         
-        for i, (opcion, color) in enumerate(zip(opciones, colores)):
-            x_boton = 20 + i * espacio_boton
-            
+        for i, (opcion, color, (x0, y0, x1, y1)) in enumerate(zip(opciones, colores, botones)):
             # Fondo del botón
             color_fondo = color if self.confirmacion_opcion == i else (100, 100, 100)
-            cv2.rectangle(frame, (x_boton, y_botones-25), (x_boton + espacio_boton - 10, y_botones + 15), 
-                         color_fondo, -1)
-            cv2.rectangle(frame, (x_boton, y_botones-25), (x_boton + espacio_boton - 10, y_botones + 15), 
-                         (255, 255, 255), 2)
+            _rectangulo_panel(frame, (x0, y0), (x1, y1), color_fondo, (255, 255, 255))
             
             # Texto del botón
             color_texto = (0, 0, 0) if self.confirmacion_opcion == i else (255, 255, 255)
-            cv2.putText(frame, opcion, (x_boton + 10, y_botones), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, color_texto, 2)
+            cv2.putText(frame, opcion, (x0 + 10, y1 - 15), 
+                       _FONT, 0.6, color_texto, 2)
         
         # Instrucciones
         cv2.putText(frame, "Apunta con el dedo indice y cierra el puño para seleccionar", 
-                   (20, altura-40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                   (20, altura-40), _FONT, 0.5, (255, 255, 255), 1)
     
     def _detectar_boton_confirmacion(self, x: int, y: int, frame: np.ndarray) -> int:
         """Detecta en qué botón de confirmación está el dedo"""
-        altura, ancho = frame.shape[:2]
-        y_botones = altura - 80
-        espacio_boton = (ancho - 40) // 3
-        
-        # Verificar si está en el área de botones
-        if y_botones - 25 <= y <= y_botones + 15:
-            for i in range(3):
-                x_boton = 20 + i * espacio_boton
-                if x_boton <= x <= x_boton + espacio_boton - 10:
-                    return i
+        self._actualizar_layout(frame)
+        for i, (x0, y0, x1, y1) in enumerate(self._layout['botones_confirmacion']):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return i
         return -1
     
     def _ejecutar_opcion_confirmacion(self):
         """Ejecuta la opción seleccionada en la confirmación"""
-        if self.confirmacion_opcion == 0:  # Confirmar
-            self._confirmar_calibracion_final()
-        elif self.confirmacion_opcion == 1:  # Recalibrar
-            self._reiniciar_calibracion()
-        elif self.confirmacion_opcion == 2:  # Cancelar
-            self._cancelar_calibracion()
+        acciones = (
+            self._confirmar_calibracion_final,  # 0 = Confirmar
+            self._reiniciar_calibracion,        # 1 = Recalibrar
+            self._cancelar_calibracion,         # 2 = Cancelar
+        )
+        if 0 <= self.confirmacion_opcion < len(acciones):
+            acciones[self.confirmacion_opcion]()
     
     def _confirmar_calibracion_final(self):
         """Confirma y finaliza la calibración"""
         try:
             # Crear matriz de transformación
-            self.matriz_transformacion = cv2.getPerspectiveTransform(
-                np.float32(self.puntos_camara), 
-                np.float32(self.puntos_proyeccion)
-            )
+            self._calcular_matriz_transformacion()
             
             # Guardar calibración
             self._guardar_calibracion()
@@ -1904,8 +2504,7 @@ class DetectorGestos:
     
     def _reiniciar_calibracion(self):
         """Reinicia el proceso de calibración"""
-        self.puntos_camara.clear()
-        self.puntos_proyeccion.clear()
+        self.n_puntos_calibrados = 0
         self.esquina_actual = 0
         self.punto_calibracion_activo = False
         self.esperando_confirmacion = False
@@ -1918,8 +2517,7 @@ class DetectorGestos:
         self.calibrando = False
         self.esperando_confirmacion = False
         self.mostrar_preview_pantalla = False
-        self.puntos_camara.clear()
-        self.puntos_proyeccion.clear()
+        self.n_puntos_calibrados = 0
         self.esquina_actual = 0
         self.punto_calibracion_activo = False
         logger.info("Calibración cancelada")
@@ -1929,12 +2527,75 @@ class DetectorGestos:
 # SISTEMA PRINCIPAL
 # ================================
 
+class CapturadorCamara(threading.Thread):
+    """
+    Hilo productor que lee la cámara sin pausa y conserva solo el frame más reciente,
+    ya volteado horizontalmente.
+    
+    La lectura (E/S) y el volteo se solapan con la inferencia y el bucle principal
+    siempre procesa el último frame en lugar de uno que esperaba en la cola del driver.
+    El hilo es dueño de la cámara: detener() la libera, nunca durante una lectura.
+    """
+    
+    def __init__(self, cap: cv2.VideoCapture):
+        super().__init__(name='captura', daemon=True)
+        self.cap = cap
+        self.fallo = False  # La cámara dejó de entregar frames
+        self._frame: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._nuevo = threading.Event()
+        self._detener = threading.Event()
+        self._terminado = False  # run() ya salió: nadie está leyendo la cámara
+        self._abandonado = False  # detener() no pudo esperar: la libera run() al salir
+    
+    def run(self):
+        try:
+            while not self._detener.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    self.fallo = True
+                    self._nuevo.set()
+                    break
+                # Voltear horizontalmente para mejor experiencia (en el mismo buffer)
+                cv2.flip(frame, 1, dst=frame)
+                with self._lock:
+                    self._frame = frame
+                self._nuevo.set()
+        finally:
+            with self._lock:
+                self._terminado = True
+                if self._abandonado:
+                    self.cap.release()
+    
+    def ultimo(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """Espera un frame nuevo y lo entrega (None si no llegó a tiempo o la cámara falló)"""
+        if not self._nuevo.wait(timeout):
+            return None
+        with self._lock:
+            frame, self._frame = self._frame, None
+            self._nuevo.clear()
+        return frame
+    
+    def detener(self):
+        """
+        Detiene el hilo y libera la cámara. VideoCapture no es seguro entre hilos: si
+        una lectura sigue colgada tras la espera, la libera el propio hilo al terminar.
+        """
+        self._detener.set()
+        self.join(timeout=1.0)
+        with self._lock:
+            if self._terminado:
+                self.cap.release()
+            else:
+                self._abandonado = True
+
 class SistemaControlGestos:
     """Sistema principal que coordina la detección y control"""
     
     def __init__(self, modo: str = "pantalla"):
         self.detector = DetectorGestos(modo)
         self.cap = None
+        self.capturador: Optional[CapturadorCamara] = None
         self.ejecutandose = False
         self.dispositivo_camara_actual = 0
         self.dispositivos_disponibles = self._detectar_camaras()
@@ -1955,8 +2616,7 @@ class SistemaControlGestos:
             nuevo_dispositivo = self.dispositivos_disponibles[siguiente_indice]
             
             # Liberar cámara actual
-            if self.cap:
-                self.cap.release()
+            self._liberar_camara()
             
             # Inicializar nueva cámara
             if self.inicializar_camara(nuevo_dispositivo):
@@ -1969,27 +2629,58 @@ class SistemaControlGestos:
         else:
             logger.info("Solo hay una cámara disponible")
     
+    def _abrir_captura(self, dispositivo: int) -> cv2.VideoCapture:
+        """Abre la cámara con el backend nativo de la plataforma (respaldo: CAP_ANY)"""
+        cap = cv2.VideoCapture(dispositivo, BACKEND_CAMARA)
+        if not cap.isOpened() and BACKEND_CAMARA != cv2.CAP_ANY:
+            cap.release()
+            cap = cv2.VideoCapture(dispositivo)
+        return cap
+    
+    def _liberar_camara(self):
+        """Detiene el hilo de captura, que libera la cámara; sin hilo, la libera aquí"""
+        if self.capturador is not None:
+            self.capturador.detener()
+        elif self.cap is not None:
+            self.cap.release()
+        self.capturador = None
+        self.cap = None
+    
     def inicializar_camara(self, dispositivo: int = 0) -> bool:
         """Inicializa la cámara - Versión simplificada para macOS"""
+        self._liberar_camara()
         try:
             logger.info(f"Intentando abrir cámara {dispositivo}")
-            self.cap = cv2.VideoCapture(dispositivo)
+            self.cap = self._abrir_captura(dispositivo)
             
             if not self.cap.isOpened():
                 logger.warning(f"No se pudo abrir cámara {dispositivo}, probando alternativas...")
+                self.cap.release()
+                
+                # Probar los dispositivos alternativos en paralelo (cada apertura fallida
+                # puede tardar hasta segundos) y quedarse con el primero por preferencia.
+                # En macOS, AVFoundation solo pide la autorización de la cámara desde el
+                # hilo principal: allí se prueban en serie, parando en la primera
+                alternativas = [d for d in (1, 0, 2) if d != dispositivo]
+                logger.info(f"Probando cámaras {alternativas}")
+                if sys.platform == 'darwin':
+                    capturas = (self._abrir_captura(d) for d in alternativas)
+                else:
+                    with ThreadPoolExecutor(max_workers=len(alternativas)) as ejecutor:
+                        capturas = list(ejecutor.map(self._abrir_captura, alternativas))
                 
-                # Probar dispositivos alternativos
-                for alt_dispositivo in [1, 0, 2]:
-                    if alt_dispositivo != dispositivo:
-                        logger.info(f"Probando cámara {alt_dispositivo}")
-                        self.cap = cv2.VideoCapture(alt_dispositivo)
-                        if self.cap.isOpened():
-                            self.dispositivo_camara_actual = alt_dispositivo
-                            logger.info(f"✅ Cámara {alt_dispositivo} abierta exitosamente")
-                            break
-                        self.cap.release()
+                self.cap = None
+                for alt_dispositivo, cap in zip(alternativas, capturas):
+                    if self.cap is None and cap.isOpened():
+                        self.cap = cap
+                        self.dispositivo_camara_actual = alt_dispositivo
+                        logger.info(f"✅ Cámara {alt_dispositivo} abierta exitosamente")
+                        if sys.platform == 'darwin':
+                            break  # En serie: las siguientes ni se llegan a abrir
+                    else:
+                        cap.release()
                 
-                if not self.cap.isOpened():
+                if self.cap is None:
                     logger.error("❌ No se pudo abrir ninguna cámara")
                     return False
             else:
@@ -1997,16 +2688,26 @@ class SistemaControlGestos:
                 logger.info(f"✅ Cámara {dispositivo} abierta exitosamente")
             
             # Configurar propiedades básicas de la cámara
+            # MJPG permite más FPS por USB que YUYV sin comprimir; el buffer de
+            # 1 frame evita procesar frames atrasados (menos latencia gesto→cursor)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
+            if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+                # AVFoundation y algunos MSMF lo ignoran; el hilo de captura lee sin
+                # pausa, así que la cola del driver se vacía igualmente
+                logger.debug("El backend de la cámara no admite CAP_PROP_BUFFERSIZE")
+            
+            # Leer en un hilo propio: el bucle principal toma siempre el último frame
+            self.capturador = CapturadorCamara(self.cap)
+            self.capturador.start()
             
             return True
             
         except Exception as e:
             logger.error(f"Error inicializando cámara: {e}")
             return False
-            return False
     
     def ejecutar(self):
         """Ejecuta el bucle principal del sistema"""
@@ -2038,13 +2739,21 @@ class SistemaControlGestos:
                     self.cambiar_camara()
                     self.detector.cambiar_camara_solicitado = False
                 
-                ret, frame = self.cap.read()
-                if not ret:
-                    logger.error("Error capturando frame de la cámara")
-                    break
+                capturador = self.capturador
+                frame = capturador.ultimo() if capturador is not None else None
+                if frame is None:
+                    if capturador is None or capturador.fallo:
+                        logger.error("Error capturando frame de la cámara")
+                        break
+                    # Cámara atascada: la ventana sigue atendiendo eventos y Q/Esc
+                    if not self.detector.manejar_teclas(cv2.waitKey(1) & 0xFF):
+                        break
+                    continue
                 
-                # Voltear horizontalmente para mejor experiencia
-                frame = cv2.flip(frame, 1)
+                # Escala del cursor según el tamaño real del frame (cambia con la cámara)
+                altura, ancho = frame.shape[:2]
+                if (ancho, altura) != self.detector._tamaño_frame:
+                    self.detector.actualizar_tamaño_frame(ancho, altura)
                 
                 # Procesar frame
                 frame_procesado, info_gesto = self.detector.procesar_frame(frame)
@@ -2053,7 +2762,7 @@ class SistemaControlGestos:
                 altura, ancho = frame_procesado.shape[:2]
                 info_camara = f"Camara {self.dispositivo_camara_actual} | {len(self.dispositivos_disponibles)} disponibles"
                 cv2.putText(frame_procesado, info_camara, (ancho - 300, altura - 20), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+                           _FONT, 0.5, (200, 200, 200), 1)
                 
                 # Mostrar resultado
                 cv2.imshow('Detector de Gestos v3.0', frame_procesado)
@@ -2076,8 +2785,7 @@ class SistemaControlGestos:
         """Finaliza el sistema y libera recursos"""
         self.ejecutandose = False
         
-        if self.cap:
-            self.cap.release()
+        self._liberar_camara()
         
         cv2.destroyAllWindows()
         self.detector.finalizar()
@@ -2096,6 +2804,12 @@ def main():
                        help='Índice del dispositivo de cámara (default: 0)')
     parser.add_argument('--debug', action='store_true',
                        help='Activar modo debug con logging detallado')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='Inferencia en segundo plano (más FPS, un frame de latencia)')
+    parser.add_argument('--lado-inferencia', type=int, default=None, metavar='PX',
+                       help='Lado mayor del frame que recibe MediaPipe (default: config.json, 320)')
+    parser.add_argument('--sin-landmarks', action='store_true',
+                       help='No dibujar el esqueleto de las manos (máximo FPS)')
     
     args = parser.parse_args()
     
@@ -2112,6 +2826,12 @@ def main():
     
     try:
         sistema = SistemaControlGestos(modo=args.modo)
+        if args.pipeline:
+            sistema.detector.configuracion.pipeline_inferencia = True
+        if args.lado_inferencia:
+            sistema.detector.configuracion.lado_max_inferencia = max(64, args.lado_inferencia)
+        if args.sin_landmarks:
+            sistema.detector.configuracion.dibujar_landmarks = False
         exito = sistema.ejecutar()
         
         if exito:
@@ -8,11 +8,94 @@ y configurar el sistema para su uso.
 """
 
 import sys
+import json
+import re
+import shutil
 import subprocess
+import threading
+import time
 import os
 import platform
+from importlib.util import find_spec
+from io import StringIO
 from pathlib import Path
 
+# Caché de pip propia del proyecto: persiste entre entornos virtuales, así que
+# una reinstalación reutiliza las ruedas ya descargadas o compiladas
+PIP_CACHE_DIR = Path.home() / ".cache" / "detector_gestos_pip"
+
+# Con pip a partir de esta versión no se intenta actualizar (evita consultar PyPI)
+PIP_VERSION_MINIMA = (23, 0)
+
+# Dependencias con versiones y hashes fijados (opcional), generadas con:
+#   pip-compile --generate-hashes requirements.txt -o requirements.lock
+LOCKFILE = "requirements.lock"
+
+# El sistema operativo no cambia durante la instalación: se consulta una sola vez
+SISTEMA = platform.system()
+
+# Avisos de dependencias del sistema por sistema operativo
+AVISOS_SISTEMA = {
+    "Darwin": [
+        "   ℹ️  macOS detectado",
+        "   📝 Recomendaciones adicionales:",
+        "      • Instalar Homebrew si no está instalado",
+        "      • Configurar permisos de cámara y accesibilidad",
+    ],
+    "Windows": [
+        "   ℹ️  Windows detectado",
+        "   📝 Instalando dependencias adicionales...",
+        "   ℹ️  Si hay errores, instala Visual C++ Redistributable:",
+        "      https://aka.ms/vs/17/release/vc_redist.x64.exe",
+    ],
+    "Linux": [
+        "   ℹ️  Linux detectado",
+        "   📦 Instalando dependencias del sistema...",
+    ],
+}
+
+# apt-get sin preguntas interactivas ('env' porque sudo descarta el entorno)
+APT_GET = ["sudo", "env", "DEBIAN_FRONTEND=noninteractive", "apt-get"]
+
+# Paquetes del sistema por sistema operativo (todos en una sola transacción de apt)
+PAQUETES_SISTEMA = {
+    "Linux": ["python3-opencv", "python3-tk", "python3-dev"],
+}
+
+# Si las listas de apt (*_Packages) se actualizaron hace menos de esto, no se repite 'apt-get update'
+APT_LISTAS = Path("/var/lib/apt/lists")
+VIGENCIA_APT = 24 * 3600
+
+# Launcher de cada sistema operativo (Linux no tiene)
+LAUNCHERS = {
+    "Darwin": "./launch_macos.sh",
+    "Windows": "launch_windows.bat",
+}
+
+# Dónde conceder los permisos en cada sistema operativo
+PERMISOS = {
+    "Darwin": [
+        "   • Preferencias del Sistema > Seguridad y privacidad > Cámara",
+        "   • Preferencias del Sistema > Seguridad y privacidad > Accesibilidad",
+    ],
+    "Windows": [
+        "   • Configuración > Privacidad > Cámara",
+        "   • Ejecutar como administrador si hay problemas",
+    ],
+}
+
+def pip_install(*argumentos):
+    """Comando 'pip install' con la caché del proyecto y preferencia por ruedas binarias"""
+    return [sys.executable, "-m", "pip", "install", "--cache-dir", str(PIP_CACHE_DIR),
+            "--prefer-binary", *argumentos]
+
+def uv_pip_install(*argumentos):
+    """Comando 'uv pip install' para este mismo intérprete, o None si uv no está en el PATH"""
+    uv = shutil.which("uv")
+    if uv is None:
+        return None
+    return [uv, "pip", "install", "--python", sys.executable, *argumentos]
+
 def print_banner():
     """Muestra el banner del instalador"""
     print("=" * 70)
@@ -20,23 +103,63 @@ def print_banner():
     print("=" * 70)
     print()
 
-def run_command(command, description=""):
-    """Ejecuta un comando y maneja errores"""
+def _leer_flujo(flujo, lineas):
+    """Lee una salida del proceso línea a línea: la muestra en vivo y la guarda"""
+    for linea in flujo:
+        lineas.append(linea)
+        print(f"   {linea}", end="")
+    flujo.close()
+
+def run_command(argv, description=""):
+    """
+    Ejecuta un comando (lista de argumentos, sin shell intermedio) y maneja errores.
+    
+    La salida se muestra mientras se produce: un hilo por flujo (stdout y stderr)
+    los vacía a la vez, así que ninguno llena su pipe y bloquea al proceso.
+    """
     if description:
         print(f"🔄 {description}...")
     
     try:
-        result = subprocess.run(command, shell=True, check=True, 
-                              capture_output=True, text=True)
-        if description:
-            print(f"   ✅ {description} - Completado")
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
+        proceso = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, bufsize=1)
+    except OSError as e:
+        # Sin shell, un ejecutable inexistente (p. ej. sudo) llega como excepción
         if description:
             print(f"   ❌ {description} - Error: {e}")
-            print(f"   📋 Salida: {e.stdout}")
-            print(f"   📋 Error: {e.stderr}")
-        return False, e.stderr
+        return False, str(e)
+    
+    salida, errores = [], []
+    lectores = [threading.Thread(target=_leer_flujo, args=(proceso.stdout, salida), daemon=True),
+                threading.Thread(target=_leer_flujo, args=(proceso.stderr, errores), daemon=True)]
+    for lector in lectores:
+        lector.start()
+    for lector in lectores:
+        lector.join()
+    proceso.wait()
+    
+    if proceso.returncode == 0:
+        if description:
+            print(f"   ✅ {description} - Completado")
+        return True, "".join(salida)
+    
+    if description:
+        print(f"   ❌ {description} - Error: el comando terminó con código {proceso.returncode}")
+    return False, "".join(errores)
+
+def instalar_paquetes(argumentos, description):
+    """
+    Instala paquetes con uv si está disponible (resuelve y descarga mucho más
+    rápido, con su propia caché) y, si no está o falla, con pip.
+    """
+    cmd = uv_pip_install(*argumentos)
+    if cmd is not None:
+        success, output = run_command(cmd, f"{description} con uv")
+        if success:
+            return success, output
+        print("   ⚠️  uv no pudo completar la instalación, reintentando con pip...")
+    
+    return run_command(pip_install(*argumentos), description)
 
 def check_python():
     """Verifica la versión de Python"""
@@ -50,12 +173,26 @@ def check_python():
         print(f"   ❌ Python {version.major}.{version.minor} - Se requiere 3.7+")
         return False
 
+def pip_version():
+    """Versión (mayor, menor) de pip instalada, o None si no se puede leer"""
+    try:
+        from importlib.metadata import version  # Python 3.8+
+        return tuple(int(parte) for parte in version("pip").split(".")[:2])
+    except Exception:
+        return None
+
 def upgrade_pip():
-    """Actualiza pip a la última versión"""
+    """Actualiza pip a la última versión (solo si es más antiguo que PIP_VERSION_MINIMA)"""
+    actual = pip_version()
+    if actual is not None and actual >= PIP_VERSION_MINIMA:
+        print(f"📦 pip {actual[0]}.{actual[1]} ya está actualizado")
+        return True
+    
     print("📦 Actualizando pip...")
     
+    # 'wheel' permite a pip guardar en caché las ruedas que compila
     commands = [
-        f"{sys.executable} -m pip install --upgrade pip"
+        pip_install("--upgrade", "pip", "wheel")
     ]
     
     for cmd in commands:
@@ -65,16 +202,58 @@ def upgrade_pip():
             
     return True
 
+def requisitos_satisfechos(*argumentos):
+    """
+    Indica si pip no tendría nada que instalar (simulación con --dry-run --report).
+    
+    Cualquier fallo (pip antiguo sin --report, error de red...) cuenta como "no",
+    y entonces se hace la instalación real.
+    """
+    cmd = pip_install("--dry-run", "--quiet", "--report", "-", *argumentos)
+    try:
+        resultado = subprocess.run(cmd, capture_output=True, text=True)
+        return resultado.returncode == 0 and not json.loads(resultado.stdout)["install"]
+    except (OSError, ValueError, KeyError):
+        return False
+
+def install_lockfile():
+    """
+    Instala desde requirements.lock (versiones fijadas con hashes), si existe.
+    
+    Con todo fijado pip no tiene que resolver versiones, y --require-hashes
+    comprueba cada archivo descargado. Devuelve False si no hay lockfile o falla.
+    """
+    if not Path(LOCKFILE).exists():
+        return False
+    
+    print(f"🔒 Instalando dependencias fijadas desde {LOCKFILE}...")
+    argumentos = ("--require-hashes", "-r", LOCKFILE)
+    if requisitos_satisfechos(*argumentos):
+        print("   ✅ Todas las dependencias ya están instaladas")
+        return True
+    
+    success, output = instalar_paquetes(argumentos, "Instalando dependencias fijadas")
+    if not success:
+        print(f"   ⚠️  Error instalando desde {LOCKFILE}, se usará requirements.txt...")
+    return success
+
 def install_requirements():
-    """Instala las dependencias desde requirements.txt"""
+    """Instala las dependencias desde requirements.lock o requirements.txt"""
+    if install_lockfile():
+        return True
+    
     print("📋 Instalando dependencias desde requirements.txt...")
     
     if not Path("requirements.txt").exists():
         print("   ❌ Archivo requirements.txt no encontrado")
         return install_manual_dependencies()
     
-    cmd = f"{sys.executable} -m pip install -r requirements.txt"
-    success, output = run_command(cmd, "Instalando dependencias")
+    # Si ya está todo instalado no hace falta la instalación completa
+    if requisitos_satisfechos("-r", "requirements.txt"):
+        print("   ✅ Todas las dependencias ya están instaladas")
+        return True
+    
+    success, output = instalar_paquetes(("-r", "requirements.txt"), "Instalando dependencias")
     
     if not success:
         print("   ⚠️  Error instalando desde requirements.txt, intentando instalación manual...")
@@ -82,6 +261,23 @@ def install_requirements():
     
     return True
 
+# Mensajes de error de pip que nombran los requisitos que fallaron
+_ERRORES_PIP = re.compile(
+    r"(?:satisfies the requirement|No matching distribution found for|"
+    r"Failed building wheel for|Could not build wheels for)\s+([A-Za-z0-9._-]+)"
+    r"|Failed to build ((?:[A-Za-z0-9._-]+ ?)+)")
+
+def _nombre_proyecto(requisito):
+    """Nombre normalizado de un requisito ('opencv_python>=4.5' -> 'opencv-python')"""
+    return re.split(r"[<>=!~;\[\s]", requisito, maxsplit=1)[0].lower().replace("_", "-")
+
+def paquetes_fallidos(salida, paquetes):
+    """Entradas de 'paquetes' que la salida de error de pip señala como fallidas"""
+    nombres = set()
+    for uno, varios in _ERRORES_PIP.findall(salida):
+        nombres.update(_nombre_proyecto(nombre) for nombre in (uno or varios).split())
+    return [paquete for paquete in paquetes if _nombre_proyecto(paquete) in nombres]
+
 def install_manual_dependencies():
     """Instala dependencias manualmente"""
     print("🔧 Instalación manual de dependencias...")
@@ -93,48 +289,75 @@ def install_manual_dependencies():
         "pyautogui>=0.9.54"
     ]
     
-    for package in packages:
-        cmd = f"{sys.executable} -m pip install {package}"
-        success, output = run_command(cmd, f"Instalando {package}")
+    # Un solo pip para todos y solo con ruedas binarias: nunca se compila nada
+    # desde el código fuente (numpy, por ejemplo, tarda minutos y necesita C++)
+    success, output = instalar_paquetes(("--only-binary=:all:", *packages),
+                                        f"Instalando {len(packages)} paquetes (ruedas binarias)")
+    if success:
+        return True
+    
+    sin_rueda = re.findall(r"No matching distribution found for (\S+)", output)
+    if sin_rueda:
+        print(f"   ⚠️  No hay rueda binaria para {', '.join(sin_rueda)} en esta plataforma")
+    print("   ⚠️  Reintentando con compilación desde el código fuente (puede tardar varios minutos)...")
+    
+    success, output = instalar_paquetes(packages, f"Instalando {len(packages)} paquetes")
+    if success:
+        return True
+    
+    # pip no instala nada si falla el lote: el resto se instala junto y solo los
+    # paquetes que nombra el error se reintentan uno por uno (si el error no nombra
+    # ninguno, p. ej. falló una dependencia indirecta, se reintentan todos)
+    pendientes = paquetes_fallidos(output, packages) or packages
+    resto = [package for package in packages if package not in pendientes]
+    print(f"   ⚠️  Error en la instalación conjunta, reintentando por separado: {', '.join(pendientes)}")
+    
+    fallidos = []
+    if resto:
+        success, output = instalar_paquetes(resto, f"Instalando {len(resto)} paquetes restantes")
+        if not success:
+            fallidos.extend(resto)
+    for package in pendientes:
+        success, output = instalar_paquetes((package,), f"Instalando {package}")
         if not success:
-            print(f"   ❌ Error instalando {package}")
-            return False
+            fallidos.append(package)
     
+    if fallidos:
+        print(f"   ❌ Error instalando {', '.join(fallidos)}")
+        return False
     return True
 
+def apt_listas_recientes():
+    """
+    Indica si las listas de paquetes de apt existen y tienen menos de VIGENCIA_APT
+    segundos. Se miran los archivos *_Packages y no el directorio: borrar las listas
+    (rm -rf /var/lib/apt/lists/*, habitual en imágenes) también lo deja "reciente".
+    """
+    try:
+        fechas = [lista.stat().st_mtime for lista in APT_LISTAS.glob("*_Packages*")]
+    except OSError:
+        return False
+    return bool(fechas) and time.time() - max(fechas) < VIGENCIA_APT
+
 def install_system_dependencies():
     """Instala dependencias específicas del sistema"""
-    system = platform.system()
-    print(f"🖥️  Configurando dependencias para {system}...")
-    
-    if system == "Darwin":  # macOS
-        print("   ℹ️  macOS detectado")
-        print("   📝 Recomendaciones adicionales:")
-        print("      • Instalar Homebrew si no está instalado")
-        print("      • Configurar permisos de cámara y accesibilidad")
-        
-    elif system == "Windows":  # Windows
-        print("   ℹ️  Windows detectado")
-        print("   📝 Instalando dependencias adicionales...")
-        
-        # Intentar instalar Visual C++ redistributable info
-        print("   ℹ️  Si hay errores, instala Visual C++ Redistributable:")
-        print("      https://aka.ms/vs/17/release/vc_redist.x64.exe")
-        
-    elif system == "Linux":  # Linux
-        print("   ℹ️  Linux detectado")
-        print("   📦 Instalando dependencias del sistema...")
-        
-        linux_packages = [
-            "sudo apt-get update",
-            "sudo apt-get install -y python3-opencv",
-            "sudo apt-get install -y python3-tk python3-dev"
-        ]
+    print(f"🖥️  Configurando dependencias para {SISTEMA}...")
+    
+    for linea in AVISOS_SISTEMA.get(SISTEMA, ()):
+        print(linea)
+    
+    paquetes = PAQUETES_SISTEMA.get(SISTEMA)
+    if paquetes:
+        comandos = [APT_GET + ["install", "-y", *paquetes]]
+        if apt_listas_recientes():
+            print("   ℹ️  Listas de apt actualizadas hace menos de un día, se omite 'apt-get update'")
+        else:
+            comandos.insert(0, APT_GET + ["update"])
         
-        for cmd in linux_packages:
-            success, output = run_command(cmd, f"Ejecutando {cmd.split()[-1]}")
+        for cmd in comandos:
+            success, output = run_command(cmd, f"Ejecutando apt-get {cmd[len(APT_GET)]}")
             if not success:
-                print(f"   ⚠️  Error con {cmd}, continuando...")
+                print(f"   ⚠️  Error con {' '.join(cmd)}, continuando...")
     
     return True
 
@@ -148,8 +371,16 @@ def create_virtual_environment():
     
     print("🏗️  Creando entorno virtual...")
     
-    cmd = f"{sys.executable} -m venv detector_gestos_env"
+    # El entorno se crea sin pip y luego se instala con ensurepip en un paso
+    # aparte, en modo aislado (-I), para que cada fase informe de su propio error
+    cmd = [sys.executable, "-m", "venv", "--without-pip", str(venv_path)]
     success, output = run_command(cmd, "Creando entorno virtual")
+    if not success:
+        return False
+    
+    venv_python = venv_path / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+    cmd = [str(venv_python), "-Im", "ensurepip", "--upgrade", "--default-pip"]
+    success, output = run_command(cmd, "Instalando pip en el entorno virtual")
     
     return success
 
@@ -158,24 +389,22 @@ def verify_installation():
     print("✅ Verificando instalación...")
     
     try:
-        # Verificar que se puede importar cada dependencia
-        import cv2
-        print("   ✅ OpenCV - OK")
+        # Verificar que cada dependencia está instalada (find_spec la localiza sin
+        # ejecutarla: importar mediapipe o pyautogui solo para esto es lento)
+        modulos = (("cv2", "OpenCV"), ("mediapipe", "MediaPipe"),
+                   ("numpy", "NumPy"), ("pyautogui", "PyAutoGUI"))
+        for modulo, nombre in modulos:
+            if find_spec(modulo) is None:
+                print(f"   ❌ {nombre} - No instalado")
+                return False
+            print(f"   ✅ {nombre} - OK")
         
-        import mediapipe
-        print("   ✅ MediaPipe - OK")
-        
-        import numpy
-        print("   ✅ NumPy - OK")
-        
-        import pyautogui
-        print("   ✅ PyAutoGUI - OK")
-        
-        # Verificar acceso básico a la cámara
-        cap = cv2.VideoCapture(0)
-        if cap.isOpened():
+        # Verificar acceso básico a la cámara con la captura compartida del
+        # verificador: si luego se verifica el sistema en este mismo proceso, el
+        # dispositivo no se vuelve a abrir (se libera al salir)
+        from verificar_sistema import obtener_camara
+        if obtener_camara(0).isOpened():
             print("   ✅ Acceso a cámara - OK")
-            cap.release()
         else:
             print("   ⚠️  Acceso a cámara - Verificar permisos")
         
@@ -188,33 +417,31 @@ def verify_installation():
 
 def show_next_steps():
     """Muestra los siguientes pasos después de la instalación"""
-    print("\n" + "=" * 70)
-    print("    SIGUIENTES PASOS")
-    print("=" * 70)
+    # Se compone en memoria y se escribe de una vez
+    texto = StringIO()
+    print("\n" + "=" * 70, file=texto)
+    print("    SIGUIENTES PASOS", file=texto)
+    print("=" * 70, file=texto)
+    
+    print("\n🚀 Para ejecutar el sistema:", file=texto)
+    print("   python control_gestos.py", file=texto)
+    
+    print("\n🔧 O usar los launchers:", file=texto)
+    if SISTEMA in LAUNCHERS:
+        print(f"   {LAUNCHERS[SISTEMA]}", file=texto)
+    
+    print("\n🔍 Para verificar el sistema:", file=texto)
+    print("   python verificar_sistema.py", file=texto)
+    
+    print("\n📖 Para más información:", file=texto)
+    print("   • Consulta README_v2.md", file=texto)
+    print("   • Revisa config.json para configuración avanzada", file=texto)
+    
+    print(f"\n🔐 Configuración de permisos ({SISTEMA}):", file=texto)
+    for linea in PERMISOS.get(SISTEMA, ()):
+        print(linea, file=texto)
     
-    print("\n🚀 Para ejecutar el sistema:")
-    print("   python control_gestos.py")
-    
-    print("\n🔧 O usar los launchers:")
-    if platform.system() == "Darwin":
-        print("   ./launch_macos.sh")
-    elif platform.system() == "Windows":
-        print("   launch_windows.bat")
-    
-    print("\n🔍 Para verificar el sistema:")
-    print("   python verificar_sistema.py")
-    
-    print("\n📖 Para más información:")
-    print("   • Consulta README_v2.md")
-    print("   • Revisa config.json para configuración avanzada")
-    
-    print(f"\n🔐 Configuración de permisos ({platform.system()}):")
-    if platform.system() == "Darwin":
-        print("   • Preferencias del Sistema > Seguridad y privacidad > Cámara")
-        print("   • Preferencias del Sistema > Seguridad y privacidad > Accesibilidad")
-    elif platform.system() == "Windows":
-        print("   • Configuración > Privacidad > Cámara")
-        print("   • Ejecutar como administrador si hay problemas")
+    sys.stdout.write(texto.getvalue())
 
 def main():
     """Función principal del instalador"""
@@ -0,0 +1,39 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Núcleos compilados de los predicados de gestos
+==============================================
+
+Versión Cython de los predicados que detectorGestos.py evalúa en cada frame.
+Reciben los 21 landmarks como un array (21, 2) float32 contiguo y la matriz
+de transformación como (3, 3) float64, sin pasar por el intérprete.
+
+Compilación: python setup.py build_ext --inplace
+Si el módulo no está compilado, detectorGestos.py usa su versión en Python.
+"""
+
+
+cpdef bint indice_extendido(const float[:, ::1] pts) noexcept nogil:
+    """Índice extendido (tip más alto que pip) y el resto de dedos doblados"""
+    return (pts[8, 1] < pts[6, 1] and
+            pts[12, 1] > pts[10, 1] and
+            pts[16, 1] > pts[14, 1] and
+            pts[20, 1] > pts[18, 1])
+
+
+cpdef bint puno_cerrado(const float[:, ::1] pts) noexcept nogil:
+    """Todos los dedos doblados (tip más bajo que pip)"""
+    return (pts[8, 1] > pts[6, 1] and
+            pts[12, 1] > pts[10, 1] and
+            pts[16, 1] > pts[14, 1] and
+            pts[20, 1] > pts[18, 1])
+
+
+cpdef (int, int) transformar_punto(const double[:, ::1] H, double x, double y) noexcept nogil:
+    """Aplica la homografía H a (x, y) y devuelve coordenadas enteras"""
+    cdef double u = H[0, 0] * x + H[0, 1] * y + H[0, 2]
+    cdef double v = H[1, 0] * x + H[1, 1] * y + H[1, 2]
+    cdef double w = H[2, 0] * x + H[2, 1] * y + H[2, 2]
+    if w != 0.0:
+        u /= w
+        v /= w
+    return <int>u, <int>v
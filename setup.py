@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Compilación opcional de los núcleos de gestos
+=============================================
+
+Compila kernels_gestos.pyx con Cython para acelerar los predicados por frame:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Sin compilar, detectorGestos.py funciona igual con la versión en Python.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="kernels_gestos",
+    ext_modules=cythonize("kernels_gestos.pyx", language_level=3),
+)